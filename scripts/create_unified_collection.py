@@ -166,7 +166,8 @@ async def create_unified_collection(collection_name="unified"):
                 "name": "knn_vector",
                 "class": "solr.DenseVectorField",
                 "vectorDimension": 768,
-                "similarityFunction": "cosine"
+                "similarityFunction": "dot_product",  # Vectors are normalized at index time
+                "vectorEncoding": "BYTE"  # and int8-quantized
             }
             
             # Add vector field type
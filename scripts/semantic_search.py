@@ -6,35 +6,102 @@ This bypasses the MCP server and directly queries Solr with vector similarity.
 
 import argparse
 import asyncio
+import functools
+import io
 import json
 import sys
 import aiohttp
-from typing import List, Dict, Any
+import numpy as np
+import orjson
+from typing import List, Dict, Any, Optional
 
+# Shared HTTP session so Ollama and Solr calls reuse keep-alive connections
+_http_session: Optional[aiohttp.ClientSession] = None
 
-async def get_embedding_from_ollama(text: str) -> List[float]:
+
+def _get_http_session() -> aiohttp.ClientSession:
+    """Return the shared aiohttp session, creating it on first use."""
+    global _http_session
+    if _http_session is None or _http_session.closed:
+        _http_session = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(limit=100, keepalive_timeout=30),
+            timeout=aiohttp.ClientTimeout(total=300, sock_connect=10),
+        )
+    return _http_session
+
+
+JSON_HEADERS = {"Content-Type": "application/json"}
+
+
+async def close_http_session():
+    """Close the shared aiohttp session if it was opened."""
+    global _http_session
+    if _http_session is not None and not _http_session.closed:
+        await _http_session.close()
+    _http_session = None
+
+
+@functools.lru_cache(maxsize=8)
+def _vector_template(dimension: int) -> str:
+    """Build the %-format template for a vector literal of the given dimension."""
+    # 9 significant digits round-trip float32, the precision Solr stores
+    return "[" + ",".join(["%.9g"] * dimension) + "]"
+
+
+def format_vector(vector: List[float]) -> str:
+    """Format a vector as a Solr KNN literal in a single C-level %-format call."""
+    return _vector_template(len(vector)) % tuple(vector)
+
+
+def quantize_query_vector(vector: List[float]) -> List[int]:
+    """L2-normalize and int8-quantize a query vector to match the indexed embeddings."""
+    array = np.asarray(vector, dtype=np.float32)
+    array /= np.linalg.norm(array) + 1e-12
+    # One scale for the whole query vector leaves the document ranking unchanged
+    scale = float(np.abs(array).max(initial=0.0)) / 127 or 1.0
+    return np.round(array / scale).astype(np.int8).tolist()
+
+
+async def get_embedding_from_ollama(text: str, session: Optional[aiohttp.ClientSession] = None) -> List[float]:
     """Get embedding for text from Ollama API."""
-    url = "http://localhost:11434/api/embeddings"
+    session = session or _get_http_session()
+    url = "http://localhost:11434/api/embed"
     data = {
         "model": "nomic-embed-text",
-        "prompt": text
+        "input": [text]
     }
     
-    async with aiohttp.ClientSession() as session:
-        async with session.post(url, json=data) as response:
-            if response.status == 200:
-                result = await response.json()
-                return result["embedding"]
-            else:
-                error_text = await response.text()
-                raise Exception(f"Ollama API error {response.status}: {error_text}")
+    async with session.post(url, data=orjson.dumps(data), headers=JSON_HEADERS) as response:
+        if response.status == 200:
+            result = orjson.loads(await response.read())
+            if "embeddings" in result:
+                return result["embeddings"][0]
+        elif response.status != 404:
+            error_text = await response.text()
+            raise Exception(f"Ollama API error {response.status}: {error_text}")
+    
+    # Older Ollama servers only expose the single-prompt endpoint
+    legacy_url = "http://localhost:11434/api/embeddings"
+    legacy_data = {
+        "model": "nomic-embed-text",
+        "prompt": text
+    }
+    async with session.post(legacy_url, data=orjson.dumps(legacy_data), headers=JSON_HEADERS) as response:
+        if response.status == 200:
+            result = orjson.loads(await response.read())
+            return result["embedding"]
+        else:
+            error_text = await response.text()
+            raise Exception(f"Ollama API error {response.status}: {error_text}")
 
 
-async def vector_search_solr(query_vector: List[float], collection: str = "unified", top_k: int = 5) -> Dict[str, Any]:
+async def vector_search_solr(query_vector: List[float], collection: str = "unified", top_k: int = 5,
+                             session: Optional[aiohttp.ClientSession] = None) -> Dict[str, Any]:
     """Perform vector similarity search in Solr using POST request with KNN query."""
+    session = session or _get_http_session()
     
     # Format vector for Solr KNN query
-    vector_str = "[" + ",".join(str(x) for x in query_vector) + "]"
+    vector_str = format_vector(quantize_query_vector(query_vector))
     
     # Build Solr query with KNN using POST
     solr_url = f"http://localhost:8983/solr/{collection}/select"
@@ -46,26 +113,23 @@ async def vector_search_solr(query_vector: List[float], collection: str = "unifi
         "limit": top_k
     }
     
-    headers = {
-        "Content-Type": "application/json"
-    }
-    
-    async with aiohttp.ClientSession() as session:
-        async with session.post(solr_url, json=query_data, headers=headers) as response:
-            if response.status == 200:
-                return await response.json()
-            else:
-                error_text = await response.text()
-                raise Exception(f"Solr error {response.status}: {error_text}")
+    async with session.post(solr_url, data=orjson.dumps(query_data), headers=JSON_HEADERS) as response:
+        if response.status == 200:
+            return orjson.loads(await response.read())
+        else:
+            error_text = await response.text()
+            raise Exception(f"Solr error {response.status}: {error_text}")
 
 
-async def hybrid_search_solr(query_vector: List[float], text_query: str = None, collection: str = "unified", top_k: int = 5) -> Dict[str, Any]:
+async def hybrid_search_solr(query_vector: List[float], text_query: str = None, collection: str = "unified", top_k: int = 5,
+                             session: Optional[aiohttp.ClientSession] = None) -> Dict[str, Any]:
     """Perform hybrid search combining vector similarity and text search."""
+    session = session or _get_http_session()
     
     solr_url = f"http://localhost:8983/solr/{collection}/select"
     
     # Build query combining vector and text search
-    vector_str = "[" + ",".join(str(x) for x in query_vector) + "]"
+    vector_str = format_vector(quantize_query_vector(query_vector))
     knn_query = f"{{!knn f=embedding topK={top_k * 2}}}{vector_str}"
     
     if text_query:
@@ -80,17 +144,12 @@ async def hybrid_search_solr(query_vector: List[float], text_query: str = None,
         "limit": top_k
     }
     
-    headers = {
-        "Content-Type": "application/json"
-    }
-    
-    async with aiohttp.ClientSession() as session:
-        async with session.post(solr_url, json=query_data, headers=headers) as response:
-            if response.status == 200:
-                return await response.json()
-            else:
-                error_text = await response.text()
-                raise Exception(f"Solr error {response.status}: {error_text}")
+    async with session.post(solr_url, data=orjson.dumps(query_data), headers=JSON_HEADERS) as response:
+        if response.status == 200:
+            return orjson.loads(await response.read())
+        else:
+            error_text = await response.text()
+            raise Exception(f"Solr error {response.status}: {error_text}")
 
 
 async def semantic_search(query_text: str, collection: str = "unified", top_k: int = 5, hybrid: bool = False):
@@ -120,19 +179,31 @@ async def semantic_search(query_text: str, collection: str = "unified", top_k: i
         docs = response.get("docs", [])
         num_found = response.get("numFound", 0)
         
-        print(f"Found {num_found} results:")
-        print("=" * 50)
+        # Normalize multi-valued fields once, then write the report in one call
+        rows = []
+        for doc in docs:
+            title = doc.get("title", "Unknown")
+            content = doc.get("content", "")
+            if isinstance(title, list):
+                title = title[0] if title else "Unknown"
+            if isinstance(content, list):
+                content = content[0] if content else ""
+            rows.append((doc.get("id", "Unknown"), title, content, doc.get("score", 0)))
         
-        for i, doc in enumerate(docs, 1):
-            score = doc.get("score", 0)
-            title = doc.get("title", ["Unknown"])[0] if isinstance(doc.get("title"), list) else doc.get("title", "Unknown")
-            content = doc.get("content", [""])[0] if isinstance(doc.get("content"), list) else doc.get("content", "")
-            
-            print(f"{i}. {title}")
-            print(f"   Score: {score:.4f}")
-            print(f"   ID: {doc.get('id', 'Unknown')}")
-            print(f"   Content: {content[:200]}...")
-            print("-" * 50)
+        separator = "-" * 50
+        out = io.StringIO()
+        write = out.write
+        write(f"Found {num_found} results:\n")
+        write("=" * 50 + "\n")
+        for i, (doc_id, title, content, score) in enumerate(rows, 1):
+            write(
+                f"{i}. {title}\n"
+                f"   Score: {score:.4f}\n"
+                f"   ID: {doc_id}\n"
+                f"   Content: {content[:200]}...\n"
+                f"{separator}\n"
+            )
+        sys.stdout.write(out.getvalue())
         
         return docs
         
@@ -145,13 +216,17 @@ async def main():
     """Main entry point."""
     parser = argparse.ArgumentParser(description="Semantic search using Ollama embeddings and Solr")
     parser.add_argument("query", help="Search query text")
-    parser.add_argument("--collection", "-c", default="unified", help="Solr collection name")
+    parser.add_argument("--collection", "-c", default="unified",
+                        help="Solr collection name; must use the unified schema (int8 embedding field)")
     parser.add_argument("--top-k", "-k", type=int, default=5, help="Number of results to return")
     parser.add_argument("--hybrid", action="store_true", help="Use hybrid search (vector + text)")
     
     args = parser.parse_args()
     
-    results = await semantic_search(args.query, args.collection, args.top_k, args.hybrid)
+    try:
+        results = await semantic_search(args.query, args.collection, args.top_k, args.hybrid)
+    finally:
+        await close_http_session()
     
     if not results:
         print("No results found or search failed.")
@@ -159,4 +234,10 @@ async def main():
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    # uvloop (the "speedups" extra) gives a faster event loop when installed
+    try:
+        import uvloop
+    except ImportError:
+        asyncio.run(main())
+    else:
+        uvloop.run(main())
@@ -6,16 +6,51 @@ This script has minimal dependencies and directly calls the Ollama API.
 
 import argparse
 import asyncio
-import json
 import os
 import sys
 import time
 import aiohttp
-from typing import Dict, List, Any
+import numpy as np
+import orjson
+from pathlib import Path
+from typing import Dict, List, Any, Optional, Tuple
+
+
+OLLAMA_BASE_URL = "http://localhost:11434"
+EMBEDDING_MODEL = "nomic-embed-text"
+EMBEDDING_DIMENSIONS = 768
+DEFAULT_BATCH_SIZE = 32  # 128 works well when Ollama runs on a GPU
+DEFAULT_CONCURRENCY = 8  # Maximum in-flight requests to Ollama or Solr
+DEFAULT_INDEX_CHUNK_SIZE = 500  # Documents per Solr update request
+
+# Shared HTTP session so Ollama and Solr calls reuse keep-alive connections
+_http_session: Optional[aiohttp.ClientSession] = None
+
+
+def _get_http_session() -> aiohttp.ClientSession:
+    """Return the shared aiohttp session, creating it on first use."""
+    global _http_session
+    if _http_session is None or _http_session.closed:
+        _http_session = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(limit=100, keepalive_timeout=30),
+            timeout=aiohttp.ClientTimeout(total=300, sock_connect=10),
+        )
+    return _http_session
+
+
+JSON_HEADERS = {"Content-Type": "application/json"}
+
+
+async def close_http_session():
+    """Close the shared aiohttp session if it was opened."""
+    global _http_session
+    if _http_session is not None and not _http_session.closed:
+        await _http_session.close()
+    _http_session = None
 
 
 async def get_embedding_from_ollama(text: str, session: aiohttp.ClientSession) -> List[float]:
-    """Get embedding for text from Ollama API.
+    """Get embedding for text from the legacy Ollama /api/embeddings endpoint.
     
     Args:
         text: Text to get embedding for
@@ -24,48 +59,139 @@ async def get_embedding_from_ollama(text: str, session: aiohttp.ClientSession) -
     Returns:
         List of floats representing the embedding
     """
-    url = "http://localhost:11434/api/embeddings"
+    url = f"{OLLAMA_BASE_URL}/api/embeddings"
     data = {
-        "model": "nomic-embed-text",
+        "model": EMBEDDING_MODEL,
         "prompt": text
     }
     
-    async with session.post(url, json=data) as response:
+    async with session.post(url, data=orjson.dumps(data), headers=JSON_HEADERS) as response:
         if response.status == 200:
-            result = await response.json()
+            result = orjson.loads(await response.read())
             return result["embedding"]
         else:
             error_text = await response.text()
             raise Exception(f"Ollama API error {response.status}: {error_text}")
 
 
-async def generate_embeddings(texts: List[str]) -> List[List[float]]:
+async def get_embeddings_from_ollama(texts: List[str], session: aiohttp.ClientSession) -> List[List[float]]:
+    """Get embeddings for a batch of texts with a single call to Ollama /api/embed.
+    
+    Falls back to one /api/embeddings call per text on Ollama versions that
+    do not support batched embedding.
+    
+    Args:
+        texts: Texts to get embeddings for
+        session: aiohttp session
+        
+    Returns:
+        List of embedding vectors, in the same order as texts
+    """
+    url = f"{OLLAMA_BASE_URL}/api/embed"
+    data = {
+        "model": EMBEDDING_MODEL,
+        "input": texts
+    }
+    
+    async with session.post(url, data=orjson.dumps(data), headers=JSON_HEADERS) as response:
+        if response.status == 200:
+            result = orjson.loads(await response.read())
+            if "embeddings" in result:
+                return result["embeddings"]
+        elif response.status != 404:
+            error_text = await response.text()
+            raise Exception(f"Ollama API error {response.status}: {error_text}")
+    
+    # Older Ollama servers only expose the single-prompt endpoint
+    return [await get_embedding_from_ollama(text, session) for text in texts]
+
+
+async def generate_embeddings(texts: List[str], batch_size: int = DEFAULT_BATCH_SIZE,
+                              concurrency: int = DEFAULT_CONCURRENCY) -> np.ndarray:
     """Generate embeddings for a list of texts using Ollama.
     
+    Batches are sent concurrently, with at most `concurrency` requests in flight.
+    Results are written into one preallocated float32 matrix as each batch
+    completes, so progress is reported while the other requests are pending.
+    
     Args:
         texts: List of text strings to generate embeddings for
+        batch_size: Number of texts to send to Ollama per request
+        concurrency: Maximum number of concurrent Ollama requests
         
     Returns:
-        List of embedding vectors
+        Array of shape (len(texts), EMBEDDING_DIMENSIONS), one embedding per row
     """
-    embeddings = []
-    
     print(f"Generating real embeddings for {len(texts)} documents...")
     
-    async with aiohttp.ClientSession() as session:
-        for i, text in enumerate(texts):
+    embeddings = np.empty((len(texts), EMBEDDING_DIMENSIONS), dtype=np.float32)
+    session = _get_http_session()
+    semaphore = asyncio.Semaphore(concurrency)
+    
+    async def embed_batch(start: int) -> Tuple[int, int, Optional[List[List[float]]]]:
+        batch = texts[start:start + batch_size]
+        end = start + len(batch)
+        async with semaphore:
             try:
-                embedding = await get_embedding_from_ollama(text, session)
-                embeddings.append(embedding)
-                print(f"Generated embedding {i+1}/{len(texts)}")
+                vectors = await get_embeddings_from_ollama(batch, session)
+                # A malformed response only loses this batch, not the whole run
+                if np.shape(vectors) != (end - start, EMBEDDING_DIMENSIONS):
+                    raise ValueError(f"expected {end - start} embeddings of dimension {EMBEDDING_DIMENSIONS}, "
+                                     f"got shape {np.shape(vectors)}")
+                return start, end, vectors
             except Exception as e:
-                print(f"Error generating embedding for document {i+1}: {e}")
-                # Use a zero vector as fallback
-                embeddings.append([0.0] * 768)
+                print(f"Error generating embeddings for documents {start+1}-{end}: {e}")
+                return start, end, None
+    
+    # Python 3.10 has no TaskGroup; cancel whatever is still pending on the way out
+    tasks = [asyncio.ensure_future(embed_batch(start)) for start in range(0, len(texts), batch_size)]
+    done = 0
+    try:
+        for future in asyncio.as_completed(tasks):
+            start, end, vectors = await future
+            if vectors is None:
+                # Use zero vectors as fallback
+                embeddings[start:end] = 0
+            else:
+                embeddings[start:end] = np.asarray(vectors, dtype=np.float32)
+            done += end - start
+            print(f"Generated embeddings {done}/{len(texts)}")
+    finally:
+        for task in tasks:
+            task.cancel()
     
     return embeddings
 
 
+def format_solr_date(date_value: Any) -> Any:
+    """Format a date string for Solr (drop microseconds, ensure a trailing Z)."""
+    if isinstance(date_value, str):
+        if '.' in date_value:  # Has microseconds
+            parts = date_value.split('.')
+            date_value = parts[0] + 'Z'
+        elif not date_value.endswith('Z'):
+            date_value = date_value + 'Z'
+    return date_value
+
+
+# Source field -> (Solr field name, value converter), following Solr's dynamic
+# field suffixes. Built once so each document is mapped in a single pass.
+FIELD_MAP = {
+    # Basic fields (keep as is)
+    **{field: (field, None) for field in ['id', 'title', 'content', 'source', 'embedding']},
+    # Integer fields
+    **{field: (f"{field}_i", None) for field in ['section_number', 'dimensions']},
+    # Float fields
+    **{field: (f"{field}_f", None) for field in ['embedding_scale']},
+    # String fields
+    **{field: (f"{field}_s", None) for field in ['author', 'vector_model']},
+    # Date fields
+    **{field: (f"{field}_dt", format_solr_date) for field in ['date', 'date_indexed']},
+    # Multi-valued fields
+    **{field: (f"{field}_ss", None) for field in ['category', 'tags']},
+}
+
+
 def prepare_field_names(doc: Dict[str, Any]) -> Dict[str, Any]:
     """
     Prepare field names for Solr using dynamic field naming convention.
@@ -77,48 +203,21 @@ def prepare_field_names(doc: Dict[str, Any]) -> Dict[str, Any]:
         Document with properly named fields for Solr
     """
     solr_doc = {}
-    
-    # Map basic fields (keep as is)
-    for field in ['id', 'title', 'content', 'source', 'embedding']:
+    for field, (solr_field, convert) in FIELD_MAP.items():
         if field in doc:
-            solr_doc[field] = doc[field]
+            value = doc[field]
+            solr_doc[solr_field] = convert(value) if convert else value
     
     # Special handling for content if it doesn't exist but text does
     if 'content' not in solr_doc and 'text' in doc:
         solr_doc['content'] = doc['text']
     
-    # Map integer fields
-    for field in ['section_number', 'dimensions']:
-        if field in doc:
-            solr_doc[f"{field}_i"] = doc[field]
-    
-    # Map string fields
-    for field in ['author', 'vector_model']:
-        if field in doc:
-            solr_doc[f"{field}_s"] = doc[field]
-    
-    # Map date fields
-    for field in ['date', 'date_indexed']:
-        if field in doc:
-            # Format date for Solr
-            date_value = doc[field]
-            if isinstance(date_value, str):
-                if '.' in date_value:  # Has microseconds
-                    parts = date_value.split('.')
-                    date_value = parts[0] + 'Z'
-                elif not date_value.endswith('Z'):
-                    date_value = date_value + 'Z'
-            solr_doc[f"{field}_dt"] = date_value
-    
-    # Map multi-valued fields
-    for field in ['category', 'tags']:
-        if field in doc:
-            solr_doc[f"{field}_ss"] = doc[field]
-    
     return solr_doc
 
 
-async def index_documents_with_real_vectors(json_file: str, collection: str = "unified", commit: bool = True):
+async def index_documents_with_real_vectors(json_file: str, collection: str = "unified", commit: bool = True,
+                                            batch_size: int = DEFAULT_BATCH_SIZE,
+                                            concurrency: int = DEFAULT_CONCURRENCY):
     """
     Index documents with real vector embeddings into Solr.
     
@@ -126,10 +225,11 @@ async def index_documents_with_real_vectors(json_file: str, collection: str = "u
         json_file: Path to the JSON file containing documents
         collection: Solr collection name
         commit: Whether to commit after indexing
+        batch_size: Number of texts to embed per Ollama request
+        concurrency: Maximum number of concurrent Ollama/Solr requests
     """
     # Load documents
-    with open(json_file, 'r', encoding='utf-8') as f:
-        documents = json.load(f)
+    documents = orjson.loads(Path(json_file).read_bytes())
     
     # Extract text for embedding generation
     texts = []
@@ -143,21 +243,30 @@ async def index_documents_with_real_vectors(json_file: str, collection: str = "u
             texts.append(doc.get('title', ''))  # Fallback to title if no text/content
     
     # Generate real embeddings from Ollama
-    embeddings = await generate_embeddings(texts)
+    embeddings = await generate_embeddings(texts, batch_size, concurrency)
+    
+    # Normalize to unit length so the dot_product similarity equals cosine
+    embeddings /= np.linalg.norm(embeddings, axis=1, keepdims=True) + 1e-12
     
-    # Prepare documents for indexing
+    # Quantize to int8 with one symmetric scale for the whole corpus; a per-vector
+    # scale would weight each document's dot product differently and skew ranking
+    scale = float(np.abs(embeddings).max(initial=0.0)) / 127 or 1.0
+    quantized = np.round(embeddings / scale).astype(np.int8)
+    
+    # Prepare documents for indexing; documents without a date_indexed share one timestamp
+    now_iso = time.strftime('%Y-%m-%dT%H:%M:%SZ', time.gmtime())
     solr_docs = []
     for i, doc in enumerate(documents):
         doc_copy = doc.copy()
         
-        # Add real vector and metadata
-        doc_copy['embedding'] = embeddings[i]
+        # Add real vector and metadata (the row is serialized by orjson at POST time)
+        doc_copy['embedding'] = quantized[i]
+        doc_copy['embedding_scale'] = scale
         doc_copy['vector_model'] = 'nomic-embed-text'
-        doc_copy['dimensions'] = len(embeddings[i])
+        doc_copy['dimensions'] = quantized.shape[1]
         
         # Add current time as date_indexed if not present
-        if 'date_indexed' not in doc_copy:
-            doc_copy['date_indexed'] = time.strftime('%Y-%m-%dT%H:%M:%SZ', time.gmtime())
+        doc_copy.setdefault('date_indexed', now_iso)
         
         # Prepare field names according to Solr conventions
         solr_doc = prepare_field_names(doc_copy)
@@ -166,24 +275,48 @@ async def index_documents_with_real_vectors(json_file: str, collection: str = "u
     # Index documents to Solr
     print(f"Indexing {len(solr_docs)} documents to collection '{collection}'...")
     
-    async with aiohttp.ClientSession() as session:
-        for i, doc in enumerate(solr_docs):
-            solr_url = f"http://localhost:8983/solr/{collection}/update/json/docs"
-            params = {"commit": "true"} if (commit and i == len(solr_docs) - 1) else {}
-            
+    session = _get_http_session()
+    semaphore = asyncio.Semaphore(concurrency)
+    solr_url = f"http://localhost:8983/solr/{collection}/update/json"
+    
+    async def index_chunk(start: int) -> bool:
+        chunk = solr_docs[start:start + DEFAULT_INDEX_CHUNK_SIZE]
+        end = start + len(chunk)
+        async with semaphore:
             try:
-                async with session.post(solr_url, json=doc, params=params) as response:
+                async with session.post(solr_url, data=orjson.dumps(chunk, option=orjson.OPT_SERIALIZE_NUMPY),
+                                        headers=JSON_HEADERS) as response:
                     if response.status != 200:
                         error_text = await response.text()
-                        print(f"Error indexing document {doc['id']}: {response.status} - {error_text}")
+                        print(f"Error indexing documents {start+1}-{end}: {response.status} - {error_text}")
                         return False
-                        
-                    print(f"Indexed document {i+1}/{len(solr_docs)}: {doc['id']}")
+                    
+                    print(f"Indexed documents {start+1}-{end}/{len(solr_docs)}")
+                    return True
                     
             except Exception as e:
-                print(f"Error indexing document {doc['id']}: {e}")
+                print(f"Error indexing documents {start+1}-{end}: {e}")
                 return False
     
+    results = await asyncio.gather(
+        *(index_chunk(start) for start in range(0, len(solr_docs), DEFAULT_INDEX_CHUNK_SIZE))
+    )
+    if not all(results):
+        return False
+    
+    # Commit once after every document has been accepted
+    if commit:
+        commit_url = f"http://localhost:8983/solr/{collection}/update"
+        try:
+            async with session.get(commit_url, params={"commit": "true"}) as response:
+                if response.status != 200:
+                    error_text = await response.text()
+                    print(f"Error committing collection '{collection}': {response.status} - {error_text}")
+                    return False
+        except Exception as e:
+            print(f"Error committing collection '{collection}': {e}")
+            return False
+    
     print(f"Successfully indexed {len(solr_docs)} documents with real embeddings to collection '{collection}'")
     return True
 
@@ -192,8 +325,13 @@ async def main():
     """Main entry point."""
     parser = argparse.ArgumentParser(description="Index documents with real vector embeddings from Ollama")
     parser.add_argument("json_file", help="Path to the JSON file containing documents")
-    parser.add_argument("--collection", "-c", default="unified", help="Solr collection name")
+    parser.add_argument("--collection", "-c", default="unified",
+                        help="Solr collection name; must use the unified schema (int8 embedding field)")
     parser.add_argument("--no-commit", dest="commit", action="store_false", help="Don't commit after indexing")
+    parser.add_argument("--batch-size", "-b", type=int, default=DEFAULT_BATCH_SIZE,
+                        help="Texts per Ollama embedding request (try 128 on GPU)")
+    parser.add_argument("--concurrency", type=int, default=DEFAULT_CONCURRENCY,
+                        help="Maximum concurrent requests to Ollama and Solr")
     
     args = parser.parse_args()
     
@@ -201,9 +339,19 @@ async def main():
         print(f"Error: File {args.json_file} not found")
         sys.exit(1)
     
-    result = await index_documents_with_real_vectors(args.json_file, args.collection, args.commit)
+    try:
+        result = await index_documents_with_real_vectors(args.json_file, args.collection, args.commit,
+                                                         args.batch_size, args.concurrency)
+    finally:
+        await close_http_session()
     sys.exit(0 if result else 1)
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    # uvloop (the "speedups" extra) gives a faster event loop when installed
+    try:
+        import uvloop
+    except ImportError:
+        asyncio.run(main())
+    else:
+        uvloop.run(main())
@@ -16,6 +16,7 @@ from typing import Dict, List, Any
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
 from solr_mcp.embeddings.client import OllamaClient
+from solr_mcp.solr.schema import FieldManager
 
 
 async def generate_embeddings(texts: List[str]) -> List[List[float]]:
@@ -66,7 +67,19 @@ async def index_documents(json_file: str, collection: str = "testvectors", commi
             texts.append(doc.get('title', ''))
     
     # Generate embeddings
-    embeddings = await generate_embeddings(texts)
+    embeddings = np.asarray(await generate_embeddings(texts), dtype=np.float32)
+    
+    # Normalize to unit length so dot_product and cosine similarity rank alike
+    embeddings /= np.linalg.norm(embeddings, axis=-1, keepdims=True) + 1e-12
+    
+    # BYTE encoded fields (such as in the unified schema) take int8 vectors,
+    # quantized with one scale for the whole corpus to keep the ranking
+    field_info = await FieldManager("http://localhost:8983/solr").validate_vector_field_dimension(
+        collection, "embedding"
+    )
+    if field_info["vectorEncoding"] == "BYTE":
+        scale = float(np.abs(embeddings).max(initial=0.0)) / 127 or 1.0
+        embeddings = np.round(embeddings / scale).astype(np.int8)
     
     # Prepare documents for indexing
     solr_docs = []
@@ -77,7 +90,7 @@ async def index_documents(json_file: str, collection: str = "testvectors", commi
             'text': doc.get('text', doc.get('content', '')),
             'source': doc.get('source', 'unknown'),
             'vector_model': 'nomic-embed-text',
-            'embedding': embeddings[i]
+            'embedding': embeddings[i].tolist()
         }
         solr_docs.append(solr_doc)
     
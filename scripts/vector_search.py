@@ -15,6 +15,8 @@ import httpx
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
 from solr_mcp.embeddings.client import OllamaClient
+from solr_mcp.solr.schema import FieldManager
+from solr_mcp.solr.vector import encode_for_field, normalize_vector
 
 
 async def generate_query_embedding(query_text: str) -> List[float]:
@@ -49,8 +51,14 @@ async def vector_search(
         k: Number of results to return
         filter_query: Optional filter query
     """
-    # Generate embedding for the query
-    query_embedding = await generate_query_embedding(query)
+    # Generate embedding for the query, normalized like the indexed embeddings
+    # and quantized for BYTE encoded fields
+    field_info = await FieldManager(
+        "http://localhost:8983/solr"
+    ).validate_vector_field_dimension(collection, vector_field)
+    query_embedding = encode_for_field(
+        normalize_vector(await generate_query_embedding(query)), field_info
+    )
     
     # Format the vector as a string that Solr expects for KNN search
     vector_str = "[" + ",".join(str(v) for v in query_embedding) + "]"
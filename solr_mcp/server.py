@@ -1,18 +1,21 @@
 """FastMCP server implementation for Solr."""
 
 import argparse
+import contextlib
 import functools
 import logging
 import os
 import sys
-from typing import List
+from typing import Any, AsyncIterator, List, Optional
 
+import anyio
 from mcp.server import Server
 from mcp.server.fastmcp import FastMCP
 from mcp.server.sse import SseServerTransport
 from starlette.applications import Starlette
 from starlette.requests import Request
 from starlette.routing import Mount, Route
+from starlette.types import Lifespan
 
 from solr_mcp.solr.client import SolrClient
 from solr_mcp.solr.config import SolrConfig
@@ -108,10 +111,25 @@ class SolrMCPServer:
     def run(self) -> None:
         """Run the SolrMCP server."""
         logger.info("Starting SolrMCP server...")
-        if self.stdio:
-            self.mcp.run("stdio")
-        else:
-            self.mcp.run("sse")
+        anyio.run(self.run_async)
+
+    async def run_async(self) -> None:
+        """Run the SolrMCP server and clean up its resources when it stops."""
+        try:
+            if self.stdio:
+                await self.mcp.run_stdio_async()
+            else:
+                await self.mcp.run_sse_async()
+        finally:
+            await self.close()
+
+    @contextlib.asynccontextmanager
+    async def lifespan(self, app: Any) -> AsyncIterator[None]:
+        """Lifespan for an app serving this server; cleans up resources on shutdown."""
+        try:
+            yield
+        finally:
+            await self.close()
 
     async def close(self):
         """Clean up resources."""
@@ -121,7 +139,12 @@ class SolrMCPServer:
             await self.mcp.close()
 
 
-def create_starlette_app(mcp_server: Server, *, debug: bool = False) -> Starlette:
+def create_starlette_app(
+    mcp_server: Server,
+    *,
+    debug: bool = False,
+    lifespan: Optional[Lifespan[Starlette]] = None,
+) -> Starlette:
     """Create a Starlette application that can serve the provided MCP server with SSE."""
     sse = SseServerTransport("/messages/")
 
@@ -143,6 +166,7 @@ def create_starlette_app(mcp_server: Server, *, debug: bool = False) -> Starlett
             Route("/sse", endpoint=handle_sse),
             Mount("/messages/", app=sse.handle_post_message),
         ],
+        lifespan=lifespan,
     )
 
 
@@ -207,7 +231,10 @@ def main() -> None:
         server.run()
     else:
         mcp_server = server.mcp._mcp_server  # noqa: WPS437
-        starlette_app = create_starlette_app(mcp_server, debug=True)
+        # The lifespan closes the Solr client's pooled sessions on shutdown
+        starlette_app = create_starlette_app(
+            mcp_server, debug=True, lifespan=server.lifespan
+        )
         import uvicorn
 
         uvicorn.run(starlette_app, host=args.host, port=args.port)
@@ -1,10 +1,18 @@
 """SolrCloud client implementation."""
 
+import asyncio
+import functools
 import logging
-from typing import Any, Dict, List, Optional, Tuple
+import time
+from typing import Any, Dict, List, NamedTuple, Optional, Tuple, cast
 
+import aiohttp
+import orjson
 import pysolr
+import requests
 from loguru import logger
+from requests.adapters import HTTPAdapter
+from sqlglot import exp
 
 from solr_mcp.solr.collections import (
     HttpCollectionProvider,
@@ -24,12 +32,135 @@ from solr_mcp.solr.query import QueryBuilder
 from solr_mcp.solr.query.executor import QueryExecutor
 from solr_mcp.solr.response import ResponseFormatter
 from solr_mcp.solr.schema import FieldManager
-from solr_mcp.solr.vector import VectorManager, VectorSearchResults
+from solr_mcp.solr.vector import (
+    CachedEmbedding,
+    EmbeddingCache,
+    SemanticResultCache,
+    VectorManager,
+    VectorSearchResults,
+    encode_for_field,
+    normalize_vector,
+)
 from solr_mcp.vector_provider import OllamaVectorProvider
-from solr_mcp.vector_provider.constants import MODEL_DIMENSIONS
+from solr_mcp.vector_provider.constants import (
+    DEFAULT_OLLAMA_CONFIG,
+    MODEL_DIMENSIONS,
+    OLLAMA_EMBED_PATH,
+    OLLAMA_EMBEDDINGS_PATH,
+)
 
 logger = logging.getLogger(__name__)
 
+JSON_HEADERS = {"Content-Type": "application/json"}
+
+
+class PreparedKnnRequest(NamedTuple):
+    """Constant parts of a KNN request against one collection and field."""
+
+    url: str
+    knn_prefix: str
+    fields: str
+    top_k: int
+
+
+@functools.lru_cache(maxsize=128)
+def prepare_knn_request(
+    base_url: str, collection: str, field: str, top_k: int, fields: str
+) -> PreparedKnnRequest:
+    """Build the reusable parts of a KNN request so only the vector varies per call.
+
+    Args:
+        base_url: Solr base URL
+        collection: Collection to search
+        field: Vector field to search against
+        top_k: Number of results to return
+        fields: Comma-separated fields to return
+
+    Returns:
+        Prepared request
+    """
+    return PreparedKnnRequest(
+        url=f"{base_url}/{collection}/select",
+        knn_prefix=f"{{!knn f={field} topK={top_k}}}",
+        fields=fields,
+        top_k=top_k,
+    )
+
+
+async def get_ollama_embedding(
+    session: aiohttp.ClientSession, text: str
+) -> List[float]:
+    """Get the embedding for a text from Ollama.
+
+    Args:
+        session: HTTP session to send the request with
+        text: Text to embed
+
+    Returns:
+        Embedding vector
+
+    Raises:
+        SolrError: If the Ollama request fails
+    """
+    data = {"model": DEFAULT_OLLAMA_CONFIG["model"], "prompt": text}
+    async with session.post(
+        f"{DEFAULT_OLLAMA_CONFIG['base_url']}{OLLAMA_EMBEDDINGS_PATH}",
+        data=orjson.dumps(data),
+        headers=JSON_HEADERS,
+    ) as response:
+        if response.status != 200:
+            error_text = await response.text()
+            raise SolrError(f"Ollama API error {response.status}: {error_text}")
+        return cast(List[float], orjson.loads(await response.read())["embedding"])
+
+
+async def knn_search(
+    session: aiohttp.ClientSession,
+    request: PreparedKnnRequest,
+    vector_str: str,
+    offset: int = 0,
+) -> Dict[str, Any]:
+    """Run a KNN query through the Solr JSON Request API.
+
+    Args:
+        session: HTTP session to send the request with
+        request: Prepared request for the collection and field
+        vector_str: Formatted query vector
+        offset: Number of results to skip
+
+    Returns:
+        Search results in result-set format
+
+    Raises:
+        SolrError: If the Solr request fails
+    """
+    query_data = {
+        "query": request.knn_prefix + vector_str,
+        "fields": request.fields,
+        "limit": request.top_k,
+        "offset": offset,
+    }
+    async with session.post(
+        request.url, data=orjson.dumps(query_data), headers=JSON_HEADERS
+    ) as response:
+        if response.status != 200:
+            error_text = await response.text()
+            raise SolrError(f"Solr error {response.status}: {error_text}")
+        solr_result = orjson.loads(await response.read())
+
+    # Add EOF marker like other MCP responses
+    docs = solr_result.get("response", {}).get("docs", [])
+    num_found = solr_result.get("response", {}).get("numFound", 0)
+    if docs:
+        docs.append({"EOF": True})
+    return {
+        "result-set": {
+            "docs": docs,
+            "numFound": num_found + 1,  # +1 for EOF
+            "start": offset,
+        }
+    }
+
 
 class SolrClient:
     """Client for interacting with SolrCloud."""
@@ -94,10 +225,85 @@ class SolrClient:
             self, self.vector_provider, 10  # Default value for top_k
         )
 
-        # Initialize Solr client
+        # Initialize Solr client; an injected client is used for every collection
         self._solr_client = solr_client
         self._default_collection = None
 
+        # Per-collection Solr clients sharing one pooled requests session
+        self._solr_clients: Dict[str, pysolr.Solr] = {}
+        self._requests_session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=20, pool_maxsize=100)
+        self._requests_session.mount("http://", adapter)
+        self._requests_session.mount("https://", adapter)
+
+        # Shared HTTP session for direct Ollama/Solr calls, created lazily
+        self._http_session: Optional[aiohttp.ClientSession] = None
+
+        # Validated vector fields: (collection, field) -> (field, field_info, cached_at)
+        self._vector_field_cache: Dict[
+            Tuple[str, Optional[str]], Tuple[str, Dict[str, Any], float]
+        ] = {}
+
+        # Query embedding cache, plus optional reuse of near-duplicate results
+        self.embedding_cache = EmbeddingCache()
+        self.semantic_cache = (
+            SemanticResultCache(threshold=config.semantic_cache_threshold)
+            if config.semantic_cache_threshold
+            else None
+        )
+
+    def _get_http_session(self) -> aiohttp.ClientSession:
+        """Get the shared aiohttp session, creating it on first use.
+
+        Returns:
+            aiohttp session backed by a keep-alive connection pool
+        """
+        if self._http_session is None or self._http_session.closed:
+            self._http_session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=100, keepalive_timeout=30),
+                timeout=aiohttp.ClientTimeout(total=300, sock_connect=10),
+            )
+        return self._http_session
+
+    async def _get_vector_field(
+        self, collection: str, field: Optional[str], max_age: float = 300.0
+    ) -> Tuple[str, Dict[str, Any]]:
+        """Validate the vector field for a collection, reusing recent results.
+
+        Args:
+            collection: Collection name
+            field: Optional field name, auto-detected if None
+            max_age: Maximum age in seconds of a cached validation
+
+        Returns:
+            Tuple of (field name, field info)
+
+        Raises:
+            SolrError: If field validation fails
+        """
+        key = (collection, field)
+        cached = self._vector_field_cache.get(key)
+        if cached:
+            if (time.time() - cached[2]) <= max_age:
+                return cached[0], cached[1]
+            # The field manager caches the schema without expiry; drop it so
+            # schema changes are picked up
+            self.field_manager.clear_cache(collection)
+
+        field_name, field_info = await self.vector_manager.validate_vector_field(
+            collection=collection, field=field
+        )
+        self._vector_field_cache[key] = (field_name, field_info, time.time())
+        return field_name, field_info
+
+    async def close(self) -> None:
+        """Close the shared HTTP sessions."""
+        if self._http_session is not None and not self._http_session.closed:
+            await self._http_session.close()
+        self._http_session = None
+        self._solr_clients.clear()
+        self._requests_session.close()
+
     async def _get_or_create_client(self, collection: str) -> pysolr.Solr:
         """Get or create a Solr client for the given collection.
 
@@ -113,12 +319,19 @@ class SolrClient:
         if not collection:
             raise SolrError("No collection specified")
 
-        if not self._solr_client:
-            self._solr_client = pysolr.Solr(
-                f"{self.base_url}/{collection}", timeout=self.config.connection_timeout
+        if self._solr_client:
+            return self._solr_client
+
+        client = self._solr_clients.get(collection)
+        if client is None:
+            client = pysolr.Solr(
+                f"{self.base_url}/{collection}",
+                timeout=self.config.connection_timeout,
+                session=self._requests_session,
             )
+            self._solr_clients[collection] = client
 
-        return self._solr_client
+        return client
 
     async def list_collections(self) -> List[str]:
         """List all available collections."""
@@ -187,10 +400,13 @@ class SolrClient:
             # Parse and validate query
             ast, collection, _ = self.query_builder.parse_and_validate_select(query)
 
-            # Validate and potentially auto-detect vector field
-            field, field_info = await self.vector_manager.validate_vector_field(
-                collection=collection, field=field
+            # Validate and potentially auto-detect vector field while the Solr
+            # client is looked up
+            (field, field_info), client = await asyncio.gather(
+                self._get_vector_field(collection, field),
+                self._get_or_create_client(collection),
             )
+            query_vector = encode_for_field(vector, field_info)
 
             # Get limit and offset from query
             limit = 10  # Default limit
@@ -214,9 +430,8 @@ class SolrClient:
             top_k = limit + offset
 
             # Execute vector search
-            client = await self._get_or_create_client(collection)
             results = await self.vector_manager.execute_vector_search(
-                client=client, vector=vector, field=field, top_k=top_k
+                client=client, vector=query_vector, field=field, top_k=top_k
             )
 
             # Convert to VectorSearchResults
@@ -227,41 +442,24 @@ class SolrClient:
             # Build SQL query with vector results
             doc_ids = vector_results.get_doc_ids()
 
-            # Execute SQL query with the vector results
-            stmt = query  # Start with original query
-
-            # Check if query already has WHERE clause
-            has_where = "WHERE" in stmt.upper()
-            has_limit = "LIMIT" in stmt.upper()
-
-            # Extract limit part if present to reposition it
-            limit_part = ""
-            if has_limit:
-                # Use case-insensitive find and split
-                limit_index = stmt.upper().find("LIMIT")
-                stmt_before_limit = stmt[:limit_index].strip()
-                limit_part = stmt[limit_index + 5 :].strip()  # +5 to skip "LIMIT"
-                stmt = stmt_before_limit  # This is everything before LIMIT
-
-            # Add WHERE clause at the proper position
+            # Restrict the parsed query to the vector hits
             if doc_ids:
-                # Add filter query if present
-                if has_where:
-                    stmt = f"{stmt} AND id IN ({','.join(doc_ids)})"
-                else:
-                    stmt = f"{stmt} WHERE id IN ({','.join(doc_ids)})"
+                id_filter: exp.Expression = exp.In(
+                    this=exp.column("id"),
+                    expressions=[exp.Literal.string(doc_id) for doc_id in doc_ids],
+                )
             else:
                 # No vector search results, return empty result set
-                if has_where:
-                    stmt = f"{stmt} AND 1=0"  # Always false condition
-                else:
-                    stmt = f"{stmt} WHERE 1=0"  # Always false condition
+                id_filter = exp.EQ(
+                    this=exp.Literal.number(1), expression=exp.Literal.number(0)
+                )
+            filtered_ast = ast.where(id_filter, append=True)
+
+            # Keep an explicit LIMIT or add the default one
+            if filtered_ast.args.get("limit") is None:
+                filtered_ast = filtered_ast.limit(limit)
 
-            # Add limit back at the end if it was present or add default limit
-            if limit_part:
-                stmt = f"{stmt} LIMIT {limit_part}"
-            elif not has_limit:
-                stmt = f"{stmt} LIMIT {limit}"
+            stmt = filtered_ast.sql()
 
             # Execute the SQL query
             return await self.query_executor.execute_select_query(
@@ -285,9 +483,8 @@ class SolrClient:
         This replaces the complex two-step process with the proven standalone script logic.
         """
         try:
-            import aiohttp
-            import json
-            
+            session = self._get_http_session()
+
             # ── 1. Parse SQL to get collection and limits ──────────────────────────
             ast, collection, _ = self.query_builder.parse_and_validate_select(query)
             
@@ -305,88 +502,144 @@ class SolrClient:
             if ast.args.get("offset"):
                 offset = int(ast.args["offset"])
 
-            # ── 2. Generate embedding directly via Ollama API ──────────────────────
-            async def get_embedding_from_ollama(text: str) -> List[float]:
-                url = "http://localhost:11434/api/embeddings"
-                data = {
-                    "model": "nomic-embed-text",
-                    "prompt": text
-                }
-                
-                async with aiohttp.ClientSession() as session:
-                    async with session.post(url, json=data) as response:
-                        if response.status == 200:
-                            result = await response.json()
-                            return result["embedding"]
-                        else:
-                            error_text = await response.text()
-                            raise Exception(f"Ollama API error {response.status}: {error_text}")
-
-            # ── 3. Execute vector search directly via Solr API ─────────────────────
-            async def vector_search_solr(query_vector: List[float], collection: str, top_k: int):
-                # Use embedding field (already confirmed to exist)
-                vector_str = "[" + ",".join(str(x) for x in query_vector) + "]"
-                
-                solr_url = f"http://localhost:8983/solr/{collection}/select"
-                
-                # Extract field names from original SQL query for response
-                fields_to_return = self._extract_fields_from_sql(query)
-                
-                query_data = {
-                    "query": f"{{!knn f=embedding topK={top_k}}}{vector_str}",
-                    "fields": fields_to_return,
-                    "limit": top_k,
-                    "offset": offset
-                }
-                
-                headers = {"Content-Type": "application/json"}
-                
-                async with aiohttp.ClientSession() as session:
-                    async with session.post(solr_url, json=query_data, headers=headers) as response:
-                        if response.status == 200:
-                            solr_result = await response.json()
-                            
-                            # Convert Solr response to MCP format
-                            docs = solr_result.get("response", {}).get("docs", [])
-                            num_found = solr_result.get("response", {}).get("numFound", 0)
-                            
-                            # Add EOF marker like other MCP responses
-                            if docs:
-                                docs.append({"EOF": True})
-                            
-                            return {
-                                "result-set": {
-                                    "docs": docs,
-                                    "numFound": num_found + 1,  # +1 for EOF
-                                    "start": offset
-                                }
-                            }
-                        else:
-                            error_text = await response.text()
-                            raise Exception(f"Solr error {response.status}: {error_text}")
+            # ── 2. Embed the text and search Solr directly ─────────────────────────
+            async def embed_text() -> CachedEmbedding:
+                # Indexed embeddings are unit length and compared by dot product
+                model = DEFAULT_OLLAMA_CONFIG["model"]
+                cached = self.embedding_cache.get(model, text)
+                if cached is None:
+                    query_vector = normalize_vector(
+                        await get_ollama_embedding(session, text)
+                    )
+                    cached = self.embedding_cache.set(model, text, query_vector)
+                return cached
+
+            # Field validation runs while the embedding is being generated;
+            # without a field the unified schema's vector field is used
+            embedding, (vector_field, field_info) = await asyncio.gather(
+                embed_text(), self._get_vector_field(collection, field or "embedding")
+            )
+            query_vector = embedding.vector
+            vector_str = embedding.knn_literal(field_info)
+
+            # The SQL query fixes collection, fields, limit and offset
+            scope = (query, vector_field)
+            if self.semantic_cache is not None:
+                cached_result = self.semantic_cache.get(scope, query_vector)
+                if cached_result is not None:
+                    return cached_result
+
+            request = prepare_knn_request(
+                self.base_url,
+                collection,
+                vector_field,
+                limit,
+                self._extract_fields_from_sql(ast),
+            )
+            result = await knn_search(session, request, vector_str, offset)
+
+            if self.semantic_cache is not None:
+                self.semantic_cache.set(scope, query_vector, result)
 
-            # ── 4. Execute the direct approach ─────────────────────────────────────
-            query_vector = await get_embedding_from_ollama(text)
-            result = await vector_search_solr(query_vector, collection, limit)
-            
             return result
 
         except Exception as exc:
             raise SolrError(f"Semantic search failed: {exc}") from exc
 
 
-    def _extract_fields_from_sql(self, query: str) -> str:
-        """Extract field list from SQL query for Solr field parameter."""
-        query_upper = query.upper().strip()
-        
-        if query_upper.startswith("SELECT *"):
+    async def _embed_texts(self, texts: List[str]) -> List[CachedEmbedding]:
+        """Embed texts with a single Ollama request, reusing cached embeddings.
+
+        Args:
+            texts: Texts to embed
+
+        Returns:
+            Cached embedding and KNN literal for each text, in order
+
+        Raises:
+            SolrError: If the Ollama request fails
+        """
+        model = DEFAULT_OLLAMA_CONFIG["model"]
+        entries = [self.embedding_cache.get(model, text) for text in texts]
+        missing = list(
+            dict.fromkeys(text for text, entry in zip(texts, entries) if entry is None)
+        )
+        if not missing:
+            return [entry for entry in entries if entry is not None]
+
+        session = self._get_http_session()
+        async with session.post(
+            f"{DEFAULT_OLLAMA_CONFIG['base_url']}{OLLAMA_EMBED_PATH}",
+            data=orjson.dumps({"model": model, "input": missing}),
+            headers=JSON_HEADERS,
+        ) as response:
+            if response.status != 200:
+                error_text = await response.text()
+                raise SolrError(f"Ollama API error {response.status}: {error_text}")
+            vectors = orjson.loads(await response.read())["embeddings"]
+
+        # Indexed embeddings are unit length
+        embedded = {
+            text: self.embedding_cache.set(model, text, normalize_vector(vector))
+            for text, vector in zip(missing, vectors)
+        }
+        return [entry or embedded[text] for text, entry in zip(texts, entries)]
+
+    async def semantic_search_batch(
+        self,
+        texts: List[str],
+        collection: str,
+        top_k: int = 10,
+        field: str = "embedding",
+        fields: str = "id,title,content,score",
+        concurrency: int = 8,
+    ) -> List[Dict[str, Any]]:
+        """Run a semantic search for each text, sharing one embedding request.
+
+        All texts are embedded with one Ollama call, then the KNN queries are
+        sent concurrently with at most ``concurrency`` requests in flight.
+
+        Args:
+            texts: Query texts
+            collection: Collection to search
+            top_k: Number of results per query
+            field: Vector field to search against
+            fields: Comma-separated fields to return
+            concurrency: Maximum number of concurrent Solr requests
+
+        Returns:
+            Search results in result-set format for each text, in order
+
+        Raises:
+            SolrError: If embedding or any search fails
+        """
+        try:
+            # The vector field is validated while the texts are being embedded
+            embeddings, (field, field_info) = await asyncio.gather(
+                self._embed_texts(texts), self._get_vector_field(collection, field)
+            )
+            session = self._get_http_session()
+            request = prepare_knn_request(
+                self.base_url, collection, field, top_k, fields
+            )
+            semaphore = asyncio.Semaphore(concurrency)
+
+            async def search(embedding: CachedEmbedding) -> Dict[str, Any]:
+                vector_str = embedding.knn_literal(field_info)
+                async with semaphore:
+                    return await knn_search(session, request, vector_str)
+
+            return await asyncio.gather(*(search(entry) for entry in embeddings))
+        except SolrError:
+            raise
+        except Exception as exc:
+            raise SolrError(f"Batch semantic search failed: {exc}") from exc
+
+    def _extract_fields_from_sql(self, ast: exp.Select) -> str:
+        """Extract field list from a parsed SQL query for Solr field parameter."""
+        if any(isinstance(e, exp.Star) for e in ast.expressions):
             return "*"
-        elif query_upper.startswith("SELECT "):
-            # Extract field list between SELECT and FROM
-            select_part = query[6:].strip()  # Remove "SELECT "
-            from_index = select_part.upper().find(" FROM ")
-            if from_index != -1:
-                fields_part = select_part[:from_index].strip()
-                return fields_part
-        
+        if ast.expressions:
+            return ", ".join(e.sql() for e in ast.expressions)
+
         return "id,title,content,score"  # default fields
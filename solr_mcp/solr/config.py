@@ -21,6 +21,13 @@ class SolrConfig(BaseModel):
     connection_timeout: int = Field(
         default=10, gt=0, description="Connection timeout in seconds"
     )
+    semantic_cache_threshold: Optional[float] = Field(
+        default=None,
+        gt=0,
+        le=1,
+        description="Cosine similarity above which cached semantic search results "
+        "are reused. Disabled when not set.",
+    )
 
     def __init__(self, **data):
         """Initialize SolrConfig with validation error handling."""
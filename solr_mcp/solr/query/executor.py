@@ -130,14 +130,15 @@ class QueryExecutor:
                 stmt = query  # Start with original query
 
                 # Check if query already has WHERE clause
-                has_where = "WHERE" in stmt.upper()
-                has_limit = "LIMIT" in stmt.upper()
+                stmt_upper = stmt.upper()
+                has_where = "WHERE" in stmt_upper
+                has_limit = "LIMIT" in stmt_upper
 
                 # Extract limit part if present to reposition it
                 limit_part = ""
                 if has_limit:
                     # Use case-insensitive find and split
-                    limit_index = stmt.upper().find("LIMIT")
+                    limit_index = stmt_upper.find("LIMIT")
                     stmt_before_limit = stmt[:limit_index].strip()
                     limit_part = stmt[limit_index + 5 :].strip()  # +5 to skip "LIMIT"
                     stmt = stmt_before_limit  # This is everything before LIMIT
@@ -261,9 +261,13 @@ class FieldManager:
         if collection:
             self._schema_cache.pop(collection, None)
             self._field_types_cache.pop(collection, None)
+            prefix = f"{collection}:"
+            for key in [k for k in self._vector_field_cache if k.startswith(prefix)]:
+                del self._vector_field_cache[key]
         else:
             self._schema_cache = {}
             self._field_types_cache = {}
+            self._vector_field_cache = {}
 
     def _get_collection_fields(self, collection: str) -> Dict[str, Any]:
         """Get or load field information for a collection.
@@ -653,22 +657,17 @@ class FieldManager:
                     f"Field '{field}' is not a vector field (type: {field_type}, class: {field_class})"
                 )
 
-            # Get field dimension
-            vector_dimension = None
+            # Get field dimension and encoding, either of which may be set on
+            # the field itself or on its field type
+            vector_dimension = field_info.get("vectorDimension")
+            vector_encoding = field_info.get("vectorEncoding")
 
-            # First check if dimension is directly in field info
-            if "vectorDimension" in field_info:
-                vector_dimension = field_info["vectorDimension"]
-            else:
+            if not vector_dimension or not vector_encoding:
                 # Look up the field type definition
                 field_type_name = field_info.get("type")
 
-                # Get all field types
-                schema_url = f"{self.solr_base_url}/{collection}/schema"
                 try:
-                    schema_response = requests.get(schema_url)
-                    schema_data = schema_response.json()
-                    field_types = schema_data.get("schema", {}).get("fieldTypes", [])
+                    field_types = self.get_schema(collection).get("fieldTypes", [])
 
                     # Find matching field type
                     matching_type = next(
@@ -676,17 +675,17 @@ class FieldManager:
                         None,
                     )
 
-                    if matching_type and "vectorDimension" in matching_type:
-                        vector_dimension = matching_type["vectorDimension"]
-                    elif (
-                        matching_type
-                        and matching_type.get("class") == "solr.DenseVectorField"
-                    ):
-                        # For solr.DenseVectorField, dimension should be specified in the field type
-                        vector_dimension = matching_type.get("vectorDimension")
+                    if matching_type:
+                        vector_dimension = vector_dimension or matching_type.get(
+                            "vectorDimension"
+                        )
+                        vector_encoding = vector_encoding or matching_type.get(
+                            "vectorEncoding"
+                        )
                 except Exception as e:
                     logger.warning(
-                        f"Error fetching schema to determine vector dimension: {str(e)}"
+                        "Error fetching schema to determine vector field type: "
+                        f"{str(e)}"
                     )
 
             # If still not found, attempt to get from fields
@@ -719,7 +718,8 @@ class FieldManager:
                             f"but model '{vector_provider_model}' produces vectors with dimension {model_dimension}"
                         )
 
-            # Cache the result
+            # Cache the result, with the encoding Solr defaults to when unset
+            field_info = {**field_info, "vectorEncoding": vector_encoding or "FLOAT32"}
             self._vector_field_cache[cache_key] = field_info
             return field_info
 
@@ -4,6 +4,12 @@ from solr_mcp.solr.utils.formatting import (
     format_error_response,
     format_search_results,
     format_sql_response,
+    format_vector,
 )
 
-__all__ = ["format_search_results", "format_sql_response", "format_error_response"]
+__all__ = [
+    "format_search_results",
+    "format_sql_response",
+    "format_error_response",
+    "format_vector",
+]
@@ -1,8 +1,9 @@
 """Utilities for formatting Solr search results."""
 
+import functools
 import json
 import logging
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Dict, List, Optional, Sequence, Union
 
 import pysolr
 
@@ -117,3 +118,25 @@ def format_error_response(error: Exception) -> str:
         error_code = "SOLR_ERROR"
 
     return json.dumps({"error": {"code": error_code, "message": str(error)}})
+
+
+@functools.lru_cache(maxsize=8)
+def _vector_template(dimension: int) -> str:
+    """Build the %-format template for a vector literal of the given dimension."""
+    return "[" + ",".join(["%.9g"] * dimension) + "]"
+
+
+def format_vector(vector: Sequence[float]) -> str:
+    """Format a vector as a Solr KNN vector literal, e.g. ``[0.1,0.2,0.3]``.
+
+    Applies one cached %-format template to the whole vector so the float
+    formatting runs in C. Nine significant digits round-trip float32 exactly,
+    which is the precision Solr stores dense vectors at.
+
+    Args:
+        vector: Vector values
+
+    Returns:
+        Vector literal string
+    """
+    return _vector_template(len(vector)) % tuple(vector)
@@ -1,6 +1,26 @@
 """Vector search functionality."""
 
+from solr_mcp.solr.vector.cache import (
+    CachedEmbedding,
+    EmbeddingCache,
+    SemanticResultCache,
+)
+from solr_mcp.solr.vector.encoding import (
+    encode_for_field,
+    normalize_vector,
+    quantize_vector,
+)
 from solr_mcp.solr.vector.manager import VectorManager
 from solr_mcp.solr.vector.results import VectorSearchResult, VectorSearchResults
 
-__all__ = ["VectorManager", "VectorSearchResult", "VectorSearchResults"]
+__all__ = [
+    "CachedEmbedding",
+    "EmbeddingCache",
+    "SemanticResultCache",
+    "VectorManager",
+    "VectorSearchResult",
+    "VectorSearchResults",
+    "encode_for_field",
+    "normalize_vector",
+    "quantize_vector",
+]
@@ -0,0 +1,169 @@
+"""Caches for query embeddings and semantic search results."""
+
+import copy
+import hashlib
+import time
+from collections import OrderedDict, deque
+from typing import Any, Deque, Dict, Hashable, List, NamedTuple, Optional, Tuple
+
+import numpy as np
+
+from solr_mcp.solr.utils.formatting import format_vector
+from solr_mcp.solr.vector.encoding import encode_for_field
+
+
+class CachedEmbedding(NamedTuple):
+    """Embedding vector together with its Solr KNN literal per vector encoding."""
+
+    vector: List[float]
+    literals: Dict[str, str]
+
+    def knn_literal(self, field_info: Dict[str, Any]) -> str:
+        """Get the KNN literal for a vector field, formatting it on first use.
+
+        Args:
+            field_info: Field information of the vector field
+
+        Returns:
+            Formatted vector encoded for the field
+        """
+        encoding = field_info.get("vectorEncoding", "FLOAT32")
+        literal = self.literals.get(encoding)
+        if literal is None:
+            literal = format_vector(encode_for_field(self.vector, field_info))
+            self.literals[encoding] = literal
+        return literal
+
+
+class EmbeddingCache:
+    """LRU cache of embeddings and their KNN literals keyed on model and text."""
+
+    def __init__(self, max_size: int = 1024):
+        """Initialize the EmbeddingCache.
+
+        Args:
+            max_size: Maximum number of embeddings to keep
+        """
+        self.max_size = max_size
+        self._cache: "OrderedDict[str, CachedEmbedding]" = OrderedDict()
+
+    @staticmethod
+    def _key(model: str, text: str) -> str:
+        """Build the cache key for a model/text pair."""
+        return hashlib.sha256(f"{model}\0{text}".encode("utf-8")).hexdigest()
+
+    def get(self, model: str, text: str) -> Optional[CachedEmbedding]:
+        """Get the cached embedding for text.
+
+        Args:
+            model: Name of the embedding model
+            text: Embedded text
+
+        Returns:
+            Cached embedding, or None if not cached
+        """
+        key = self._key(model, text)
+        entry = self._cache.get(key)
+        if entry is not None:
+            self._cache.move_to_end(key)
+        return entry
+
+    def set(self, model: str, text: str, vector: List[float]) -> CachedEmbedding:
+        """Cache the embedding for text, evicting the least recently used entry.
+
+        KNN literals are formatted on first use for each vector encoding, so
+        cache hits skip serialization.
+
+        Args:
+            model: Name of the embedding model
+            text: Embedded text
+            vector: Embedding to cache
+
+        Returns:
+            The cached embedding
+        """
+        key = self._key(model, text)
+        entry = CachedEmbedding(vector, {})
+        self._cache[key] = entry
+        self._cache.move_to_end(key)
+        if len(self._cache) > self.max_size:
+            self._cache.popitem(last=False)
+        return entry
+
+    def clear(self) -> None:
+        """Clear all cached embeddings."""
+        self._cache.clear()
+
+    def __len__(self) -> int:
+        return len(self._cache)
+
+
+class SemanticResultCache:
+    """Reuses search results for queries whose embeddings are nearly identical."""
+
+    def __init__(
+        self, threshold: float = 0.97, max_size: int = 256, max_age: float = 300.0
+    ):
+        """Initialize the SemanticResultCache.
+
+        Args:
+            threshold: Minimum cosine similarity for a cached result to be reused
+            max_size: Maximum number of results to keep
+            max_age: Maximum age in seconds before a result is considered stale
+        """
+        self.threshold = threshold
+        self.max_age = max_age
+        self._entries: Deque[Tuple[Hashable, np.ndarray, float, Dict[str, Any]]] = (
+            deque(maxlen=max_size)
+        )
+
+    @staticmethod
+    def _normalize(vector: List[float]) -> np.ndarray:
+        """L2-normalize a vector so cosine similarity becomes a dot product."""
+        array = np.asarray(vector, dtype=np.float32)
+        norm = np.linalg.norm(array)
+        return array / norm if norm else array
+
+    def get(self, scope: Hashable, vector: List[float]) -> Optional[Dict[str, Any]]:
+        """Get the cached result of the most similar query in the same scope.
+
+        Args:
+            scope: Key identifying everything but the query text (e.g. the SQL query)
+            vector: Embedding of the query text
+
+        Returns:
+            Copy of the cached result or None if no query is similar enough
+        """
+        query = self._normalize(vector)
+        now = time.time()
+        best_result = None
+        best_similarity = self.threshold
+        for entry_scope, cached, created, result in self._entries:
+            if entry_scope != scope or (now - created) > self.max_age:
+                continue
+            if cached.shape != query.shape:
+                continue
+            similarity = float(np.dot(query, cached))
+            if similarity > best_similarity:
+                best_similarity = similarity
+                best_result = result
+        return copy.deepcopy(best_result) if best_result is not None else None
+
+    def set(self, scope: Hashable, vector: List[float], result: Dict[str, Any]) -> None:
+        """Cache a search result, evicting the oldest entry when full.
+
+        Args:
+            scope: Key identifying everything but the query text (e.g. the SQL query)
+            vector: Embedding of the query text
+            result: Search result to cache
+        """
+        self._entries.append(
+            (scope, self._normalize(vector), time.time(), copy.deepcopy(result))
+        )
+
+    def clear(self) -> None:
+        """Clear all cached results."""
+        self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
@@ -0,0 +1,57 @@
+"""Encoding helpers for vectors stored in Solr dense vector fields."""
+
+from typing import Any, Dict, List, Sequence, cast
+
+import numpy as np
+
+
+def normalize_vector(vector: Sequence[float]) -> List[float]:
+    """L2-normalize a vector so dot product similarity equals cosine similarity.
+
+    Zero vectors are returned unchanged.
+
+    Args:
+        vector: Vector values
+
+    Returns:
+        Unit-length vector as a list of floats
+    """
+    array = np.asarray(vector, dtype=np.float32)
+    return cast(List[float], (array / (np.linalg.norm(array) + 1e-12)).tolist())
+
+
+def quantize_vector(vector: Sequence[float]) -> List[int]:
+    """Quantize a vector to int8 for fields with BYTE vector encoding.
+
+    A single symmetric scale maps the largest magnitude to 127. Scaling the
+    whole query vector uniformly leaves the dot product ranking unchanged.
+
+    Args:
+        vector: Vector values
+
+    Returns:
+        Vector values rounded to the int8 range
+    """
+    array = np.asarray(vector, dtype=np.float32)
+    scale = float(np.abs(array).max(initial=0.0)) / 127 or 1.0
+    return cast(List[int], np.round(array / scale).astype(np.int8).tolist())
+
+
+def encode_for_field(
+    vector: Sequence[float], field_info: Dict[str, Any]
+) -> Sequence[float]:
+    """Encode a vector for the vector encoding of a dense vector field.
+
+    Fields with BYTE encoding take int8-quantized values; other fields take the
+    vector unchanged.
+
+    Args:
+        vector: Vector values
+        field_info: Field information of the vector field
+
+    Returns:
+        Vector values to send to Solr
+    """
+    if field_info.get("vectorEncoding") == "BYTE":
+        return quantize_vector(vector)
+    return vector
@@ -1,13 +1,14 @@
 """Vector search functionality for SolrCloud client."""
 
 import logging
-from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Sequence, Tuple
 
 import numpy as np
 import pysolr
 from loguru import logger
 
 from solr_mcp.solr.interfaces import VectorSearchProvider
+from solr_mcp.solr.utils.formatting import format_vector
 from solr_mcp.vector_provider import OllamaVectorProvider
 from solr_mcp.vector_provider.constants import MODEL_DIMENSIONS
 
@@ -100,7 +101,7 @@ class VectorManager(VectorSearchProvider):
             raise SolrError(f"Error getting vector: {str(e)}")
 
     def format_knn_query(
-        self, vector: List[float], field: str, top_k: Optional[int] = None
+        self, vector: Sequence[float], field: str, top_k: Optional[int] = None
     ) -> str:
         """Format KNN query for Solr.
 
@@ -113,7 +114,7 @@ class VectorManager(VectorSearchProvider):
             Formatted KNN query string
         """
         # Format vector as string
-        vector_str = "[" + ",".join(str(v) for v in vector) + "]"
+        vector_str = format_vector(vector)
 
         # Build KNN query
         if top_k is not None:
@@ -184,7 +185,7 @@ class VectorManager(VectorSearchProvider):
     async def execute_vector_search(
         self,
         client: pysolr.Solr,
-        vector: List[float],
+        vector: Sequence[float],
         field: str,
         top_k: Optional[int] = None,
         filter_query: Optional[str] = None,
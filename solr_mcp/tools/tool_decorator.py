@@ -1,11 +1,17 @@
-import functools
 import inspect
+import re
+import sys
+from types import UnionType
 from typing import (
+    Annotated,
     Any,
     Callable,
     Dict,
+    Iterable,
     List,
     Literal,
+    NamedTuple,
+    Optional,
     TypedDict,
     TypeVar,
     Union,
@@ -15,6 +21,32 @@ from typing import (
 
 F = TypeVar("F", bound=Callable[..., Any])
 
+_NoneType = type(None)
+
+# execute_<name>[_query] functions are registered as solr_<name>
+_TOOL_NAME_PREFIX = "execute_"
+_TOOL_NAME_SUFFIXES = ("_query",)
+
+# JSON schema of basic parameter types; copy before adding keys
+_TYPE_MAP: Dict[Any, Dict[str, str]] = {
+    str: {"type": "string"},
+    int: {"type": "integer"},
+    float: {"type": "number"},
+    bool: {"type": "boolean"},
+}
+_DEFAULT_SCHEMA = {"type": "string"}
+
+# Docstring section headers, matched case-insensitively before a colon
+_SECTION_HEADERS = frozenset({"args", "returns", "return", "examples", "example"})
+# First section header line, where the tool description ends
+_DESC_SPLIT_RE = re.compile(
+    r"^[ \t]*(?:args|returns?|examples?):", re.IGNORECASE | re.MULTILINE
+)
+# Leading and trailing whitespace of each docstring line
+_LINE_EDGE_WS_RE = re.compile(r"^[ \t]+|[ \t]+$", re.MULTILINE)
+# Start of a parameter entry: "name: description"
+_PARAM_RE = re.compile(r"^(\w+):\s*(.*)$")
+
 
 def tool() -> Callable:
     """Decorator to mark a function as an MCP tool.
@@ -37,32 +69,32 @@ def tool() -> Callable:
             Decorated function
         """
 
-        @functools.wraps(func)
-        async def wrapper(*args, **kwargs) -> Any:
-            """Wrap function call."""
-            try:
-                return await func(*args, **kwargs)
-            except Exception as e:
-                # Re-raise the exception to be handled by the caller
-                raise
-
-        # Set tool metadata
-        wrapper._is_tool = True
+        # Set tool metadata on the function itself; a wrapper would only add
+        # a coroutine per call
+        func._is_tool = True
 
         # Convert execute_list_collections -> solr_list_collections
         # Convert execute_select_query -> solr_select
         # Convert execute_vector_select_query -> solr_vector_select
         # Convert execute_semantic_select_query -> solr_semantic_select
         name = func.__name__
-        if name.startswith("execute_"):
-            name = name[8:]  # Remove 'execute_'
-            if name.endswith("_query"):
-                name = name[:-6]  # Remove '_query'
-            name = f"solr_{name}"
+        stripped = name.removeprefix(_TOOL_NAME_PREFIX)
+        if stripped != name:
+            for suffix in _TOOL_NAME_SUFFIXES:
+                stripped = stripped.removesuffix(suffix)
+            name = f"solr_{stripped}"
+
+        # Generated names are not interned automatically like identifiers are
+        func._tool_name = sys.intern(name)
+        signature = inspect.signature(func)
+        func._param_types = _param_types(func, signature)
 
-        wrapper._tool_name = name
+        # Build the schema once; tools without parameters are rejected when
+        # their schema is requested
+        if func._param_types:
+            func._tool_schema = _build_schema(func, signature)
 
-        return wrapper
+        return func
 
     return decorator
 
@@ -73,30 +105,159 @@ class ToolSchema(TypedDict):
     inputSchema: Dict[str, Any]
 
 
+class _ParamType(NamedTuple):
+    """Resolved schema kind of a parameter annotation."""
+
+    kind: str  # "scalar", "list" or "literal"
+    payload: Any  # Scalar type, list item type or literal values
+    optional: bool
+
+
+def _resolve_param_type(annotation: Any) -> _ParamType:
+    """Classify an annotation into the schema kind used for its parameter.
+
+    Args:
+        annotation: Parameter annotation
+
+    Returns:
+        Resolved parameter type
+    """
+    if get_origin(annotation) is Annotated:
+        annotation = get_args(annotation)[0]  # Metadata does not affect the schema
+    origin = get_origin(annotation)
+    args = get_args(annotation)
+
+    if origin is list or origin is List:
+        return _ParamType("list", args[0] if args else Any, False)
+    if origin is Union or origin is UnionType:
+        # One pass finds both whether None is allowed and the remaining types
+        non_none_args = [arg for arg in args if arg is not _NoneType]
+        if len(non_none_args) == len(args):
+            return _ParamType("scalar", None, False)
+        non_none_type = non_none_args[0] if non_none_args else str
+        if get_origin(non_none_type) is Literal:
+            return _ParamType("literal", get_args(non_none_type), True)
+        return _ParamType("scalar", non_none_type, True)
+    if origin is Literal:
+        # Literal 타입 처리: 가능한 값들을 enum으로 변환
+        return _ParamType("literal", args, False)
+    return _ParamType("scalar", annotation, False)
+
+
+def _param_types(func: Callable, signature: inspect.Signature) -> Dict[str, _ParamType]:
+    """Resolve the schema kind of each parameter of a function once.
+
+    String annotations are evaluated a single time. get_type_hints is not used
+    because on Python 3.10 it turns ``x: T = None`` into ``Optional[T]``.
+
+    Args:
+        func: Function to inspect
+        signature: Signature of the function
+
+    Returns:
+        Mapping of parameter name to its resolved type
+    """
+    try:
+        annotations = inspect.get_annotations(func, eval_str=True)
+    except NameError:
+        annotations = inspect.get_annotations(func)
+    return {
+        name: _resolve_param_type(annotations.get(name, param.annotation))
+        for name, param in signature.parameters.items()
+    }
+
+
+def _section_header(line: str) -> Optional[str]:
+    """Get the lowercased section header a stripped docstring line starts, if any."""
+    head, sep, _ = line.partition(":")
+    if sep:
+        head = head.lower()
+        if head in _SECTION_HEADERS:
+            return head
+    return None
+
+
+def _parse_param_docs(
+    lines: Iterable[str], param_names: Iterable[str]
+) -> Dict[str, str]:
+    """Collect parameter descriptions from the Args section in a single pass.
+
+    A parameter entry starts with ``name:``; following lines continue it only if
+    they start with ``-``. Only the first entry for each parameter is used.
+
+    Args:
+        lines: Stripped docstring lines
+        param_names: Names of the documented function's parameters
+
+    Returns:
+        Mapping of parameter name to description, for documented parameters
+    """
+    names = set(param_names)
+    entries: Dict[str, List[str]] = {}
+    in_args_section = False
+    current = None
+
+    for line in lines:
+        section = _section_header(line)
+        if section == "args":
+            in_args_section = True
+            continue
+        if current is not None:
+            if not line or section or not line.startswith(("-", f"{current}:")):
+                current = None
+            else:
+                entries[current].append(line)
+                continue
+        if in_args_section:
+            param = _PARAM_RE.match(line)
+            if param and param.group(1) in names and param.group(1) not in entries:
+                current, first_line = param.groups()
+                entries[current] = [first_line] if first_line else []
+
+    return {name: "\n".join(lines) for name, lines in entries.items() if lines}
+
+
 def get_schema(func: Callable) -> ToolSchema:
     """
     도구 함수에서 스키마 정보를 추출합니다.
+
+    The schema is built by tool() at decoration time, or on first use and stored
+    on the function for functions marked as tools elsewhere. The same object is
+    returned on every call; do not mutate it.
     """
     if not hasattr(func, "_is_tool"):
         raise ValueError(f"Function {func.__name__} is not a tool")
 
-    # 함수 독스트링에서 설명 가져오기 - Args나 Return 부분 제외
-    doc = inspect.getdoc(func) or ""
-    description_lines = []
+    schema = getattr(func, "_tool_schema", None)
+    if schema is None:
+        schema = func._tool_schema = _build_schema(func, inspect.signature(func))
+    return schema
+
+
+def _build_schema(func: Callable, signature: inspect.Signature) -> ToolSchema:
+    """Build the MCP schema of a tool function from its signature and docstring.
 
-    for line in doc.split("\n"):
-        line = line.strip()
-        if line.lower().startswith(
-            ("args:", "returns:", "return:", "examples:", "example:")
-        ):
-            break
-        description_lines.append(line)
+    Args:
+        func: Tool function
+        signature: Signature of the tool function
 
-    description = "\n".join(description_lines).strip()
+    Returns:
+        Tool schema
+
+    Raises:
+        ValueError: If the function has no parameters
+    """
+    # 함수 독스트링에서 설명 가져오기 - Args나 Return 부분 제외
+    # Docstrings are None under python -OO
+    doc = inspect.getdoc(func) or ""
+    # Only the sections after the description are split into lines
+    header = _DESC_SPLIT_RE.search(doc)
+    description_end = header.start() if header else len(doc)
+    description = _LINE_EDGE_WS_RE.sub("", doc[:description_end]).strip()
+    section_lines = [line.strip() for line in doc[description_end:].splitlines()]
 
     # Set tool name by removing 'execute_' prefix and adding 'solr_' prefix
-    sig = inspect.signature(func)
-    params = sig.parameters
+    params = signature.parameters
 
     if not params:
         raise ValueError(
@@ -106,101 +267,31 @@ def get_schema(func: Callable) -> ToolSchema:
     properties = {}
     required = []
 
-    # 기본 타입 매핑
-    type_map = {
-        str: {"type": "string"},
-        int: {"type": "integer"},
-        float: {"type": "number"},
-        bool: {"type": "boolean"},
-    }
+    # docstring에서 Args 섹션 파싱
+    # No Args section can start before the first section header
+    param_docs = _parse_param_docs(section_lines, params)
+
+    # Tools wrapped outside tool() have no precomputed type info
+    param_types = getattr(func, "_param_types", None) or _param_types(func, signature)
 
     for param_name, param in params.items():
-        param_type = param.annotation
+        kind, payload, is_optional = param_types[param_name]
 
-        if param.default == inspect.Parameter.empty:
+        if param.default is inspect.Parameter.empty and not is_optional:
             required.append(param_name)
 
-        origin = get_origin(param_type)
-        args = get_args(param_type)
-
-        is_optional = False
-
-        if origin is list or origin is List:
-            item_type = args[0] if args else Any
-            item_schema = type_map.get(item_type, {"type": "string"})
+        if kind == "list":
+            item_schema = {**_TYPE_MAP.get(payload, _DEFAULT_SCHEMA)}
             param_schema = {"type": "array", "items": item_schema}
-        elif origin is Union:
-            if type(None) in args:
-                is_optional = True
-                for arg in args:
-                    if arg is not type(None):
-                        non_none_type = arg
-                        break
-                else:
-                    non_none_type = str
-                if get_origin(non_none_type) is Literal:
-                    literal_args = get_args(non_none_type)
-                    param_schema = {"type": "string", "enum": list(literal_args)}
-                else:
-                    param_schema = type_map.get(non_none_type, {"type": "string"})
-            else:
-                param_schema = {"type": "string"}
-        elif origin is Literal:
-            # Literal 타입 처리: 가능한 값들을 enum으로 변환
-            literal_args = args
-            param_schema = {"type": "string", "enum": list(literal_args)}
+        elif kind == "literal":
+            param_schema = {"type": "string", "enum": list(payload)}
         else:
-            param_schema = type_map.get(param_type, {"type": "string"})
-
-        # docstring에서 Args 섹션 파싱
-        param_description_lines = []
-        in_args_section = False
-        capturing_description = False
+            param_schema = {**_TYPE_MAP.get(payload, _DEFAULT_SCHEMA)}
 
-        for line in doc.split("\n"):
-            line = line.strip()
-            if line.lower().startswith("args:"):
-                in_args_section = True
-                continue
-            if (
-                in_args_section
-                and not capturing_description
-                and line.startswith(f"{param_name}:")
-            ):
-                capturing_description = True
-                first_line = line[len(param_name) + 1 :].strip()
-                if first_line:
-                    param_description_lines.append(first_line)
-                continue
-            if capturing_description:
-                if (
-                    not line
-                    or line.lower().startswith(
-                        ("returns:", "return:", "examples:", "example:")
-                    )
-                    or (
-                        line
-                        and not line.startswith((" ", "\t", "-"))
-                        and not line.startswith(f"{param_name}:")
-                    )
-                ):
-                    capturing_description = False
-                    break
-                if line:
-                    param_description_lines.append(line.strip())
-
-        param_description = (
-            "\n".join(param_description_lines)
-            if param_description_lines
-            else f"{param_name} parameter"
-        )
+        param_description = param_docs.get(param_name, f"{param_name} parameter")
         param_schema["description"] = param_description
         properties[param_name] = param_schema
 
-        if param.default != inspect.Parameter.empty or is_optional:
-            if param_name in required:
-                required.remove(param_name)
-
     schema = {
         "name": func.__name__,
         "description": description,
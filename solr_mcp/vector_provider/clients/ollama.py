@@ -6,6 +6,7 @@ import requests
 from loguru import logger
 
 from solr_mcp.solr.interfaces import VectorSearchProvider
+from solr_mcp.solr.utils.formatting import format_vector
 from solr_mcp.vector_provider.constants import MODEL_DIMENSIONS, OLLAMA_EMBEDDINGS_PATH
 
 
@@ -109,7 +110,7 @@ class OllamaVectorProvider(VectorSearchProvider):
             # Build KNN query
             knn_query = {
                 "q": "*:*",
-                "knn": f"{{!knn f=vector topK={top_k}}}[{','.join(str(x) for x in vector)}]",
+                "knn": f"{{!knn f=vector topK={top_k}}}{format_vector(vector)}",
             }
 
             # Execute search
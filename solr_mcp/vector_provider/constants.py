@@ -16,6 +16,7 @@ ENV_OLLAMA_MODEL = "OLLAMA_MODEL"
 
 # HTTP endpoints
 OLLAMA_EMBEDDINGS_PATH = "/api/embeddings"
+OLLAMA_EMBED_PATH = "/api/embed"  # Accepts a list of inputs
 
 # Model-specific constants
 MODEL_DIMENSIONS = {"nomic-embed-text": 768}  # 768-dimensional vectors
@@ -28,6 +28,7 @@ def mock_config(request):
     config.solr_base_url = base_url
     config.zookeeper_hosts = zk_hosts
     config.connection_timeout = timeout
+    config.semantic_cache_threshold = None
 
     return config
 
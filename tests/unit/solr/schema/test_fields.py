@@ -412,6 +412,18 @@ def test_clear_cache_all(field_manager, mock_schema_response):
         assert mock_get_schema.call_count == 4
 
 
+def test_clear_cache_drops_vector_fields(field_manager):
+    """Test that clearing a collection drops its validated vector fields."""
+    field_manager._vector_field_cache = {
+        "test_collection:embedding": {"name": "embedding"},
+        "other_collection:embedding": {"name": "embedding"},
+    }
+
+    field_manager.clear_cache("test_collection")
+
+    assert list(field_manager._vector_field_cache) == ["other_collection:embedding"]
+
+
 def test_validate_collection_exists_success(field_manager, mock_schema_response):
     """Test validating existing collection."""
     with patch.object(field_manager, "get_schema") as mock_get_schema:
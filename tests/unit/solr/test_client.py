@@ -7,9 +7,10 @@ import aiohttp
 import pysolr
 import pytest
 import requests
+import sqlglot
 from aiohttp import test_utils
 
-from solr_mcp.solr.client import SolrClient
+from solr_mcp.solr.client import SolrClient, prepare_knn_request
 from solr_mcp.solr.exceptions import (
     ConnectionError,
     DocValuesError,
@@ -18,6 +19,42 @@ from solr_mcp.solr.exceptions import (
     SQLExecutionError,
     SQLParseError,
 )
+from solr_mcp.solr.schema import FieldManager
+
+
+class FakeResponse:
+    """Async context manager standing in for an aiohttp response."""
+
+    status = 200
+
+    def __init__(self, body):
+        self.body = body
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+    async def read(self):
+        return self.body
+
+
+def fake_session(responses):
+    """Create a mock HTTP session answering POSTs by URL suffix.
+
+    Args:
+        responses: Mapping of URL suffix to response body
+    """
+
+    def post(url, data, headers):
+        return FakeResponse(
+            next(body for suffix, body in responses.items() if url.endswith(suffix))
+        )
+
+    session = Mock()
+    session.post = Mock(side_effect=post)
+    return session
 
 
 @pytest.mark.asyncio
@@ -58,6 +95,22 @@ async def test_get_or_create_client_with_different_collection(client):
     assert solr_client is not None
 
 
+@pytest.mark.asyncio
+async def test_get_or_create_client_per_collection(client):
+    """Test that each collection gets its own cached client on a shared session."""
+    client._solr_client = None
+
+    first = await client._get_or_create_client("test_collection")
+    again = await client._get_or_create_client("test_collection")
+    other = await client._get_or_create_client("another_collection")
+
+    assert first is again
+    assert first is not other
+    assert first.url.endswith("/test_collection")
+    assert other.url.endswith("/another_collection")
+    assert first.session is other.session is client._requests_session
+
+
 @pytest.mark.asyncio
 async def test_get_or_create_client_no_collection(mock_config):
     """Test error when no collection specified."""
@@ -165,3 +218,263 @@ async def test_execute_select_query_parse_error(client):
     # Execute the query and verify the error
     with pytest.raises(SQLParseError):
         await client.execute_select_query("INVALID SQL")
+
+
+@pytest.mark.asyncio
+async def test_http_session_is_reused(client):
+    """Test that the shared HTTP session is created once and reused."""
+    session = client._get_http_session()
+    assert client._get_http_session() is session
+    await client.close()
+
+
+@pytest.mark.asyncio
+async def test_close_http_session(client):
+    """Test closing the shared HTTP session."""
+    session = client._get_http_session()
+    await client.close()
+    assert session.closed
+    assert client._http_session is None
+    # Closing again is a no-op
+    await client.close()
+
+
+@pytest.mark.asyncio
+async def test_semantic_select_uses_cached_embedding(client):
+    """Test that a cached query embedding skips the Ollama call."""
+    client.query_builder.parse_and_validate_select = Mock(
+        return_value=(
+            sqlglot.parse_one("SELECT * FROM test_collection"),
+            "test_collection",
+            None,
+        )
+    )
+    client.embedding_cache.set("nomic-embed-text", "bitcoin", [0.1, 0.2])
+    client.vector_manager.validate_vector_field = AsyncMock(
+        return_value=("embedding", {"vectorEncoding": "BYTE"})
+    )
+    session = fake_session(
+        {"/select": b'{"response": {"docs": [{"id": "1"}], "numFound": 1}}'}
+    )
+    client._get_http_session = Mock(return_value=session)
+
+    result = await client.execute_semantic_select_query(
+        "SELECT * FROM test_collection", "bitcoin"
+    )
+
+    assert result["result-set"]["docs"][0] == {"id": "1"}
+    # Only the Solr request is made; the embedding came from the cache
+    session.post.assert_called_once()
+    assert "select" in session.post.call_args.args[0]
+    # The default unified schema field is BYTE encoded
+    body = session.post.call_args.kwargs["data"]
+    assert b"{!knn f=embedding topK=10}[64,127]" in body
+
+
+@pytest.mark.asyncio
+async def test_semantic_select_validates_explicit_field(client):
+    """Test that an explicit vector field is validated and used for the KNN query."""
+    client.query_builder.parse_and_validate_select = Mock(
+        return_value=(
+            sqlglot.parse_one("SELECT * FROM test_collection"),
+            "test_collection",
+            None,
+        )
+    )
+    client.embedding_cache.set("nomic-embed-text", "bitcoin", [0.1, 0.2])
+    client.vector_manager.validate_vector_field = AsyncMock(
+        return_value=("title_vector", {"vectorEncoding": "FLOAT32"})
+    )
+    session = fake_session({"/select": b'{"response": {"docs": [], "numFound": 0}}'})
+    client._get_http_session = Mock(return_value=session)
+
+    await client.execute_semantic_select_query(
+        "SELECT * FROM test_collection", "bitcoin", field="title_vector"
+    )
+
+    client.vector_manager.validate_vector_field.assert_called_once_with(
+        collection="test_collection", field="title_vector"
+    )
+    body = session.post.call_args.kwargs["data"]
+    # FLOAT32 fields take the float embedding unquantized
+    assert b"{!knn f=title_vector topK=10}[0.1,0.2]" in body
+
+
+@pytest.mark.asyncio
+async def test_semantic_search_batch_embeds_once(client):
+    """Test that a batch embeds all new texts in one request and searches each."""
+    client.embedding_cache.set("nomic-embed-text", "cached", [0.1, 0.2])
+    client.vector_manager.validate_vector_field = AsyncMock(
+        return_value=("embedding", {"vectorEncoding": "FLOAT32"})
+    )
+    session = fake_session(
+        {
+            "/api/embed": b'{"embeddings": [[0.3, 0.4], [0.5, 0.6]]}',
+            "/select": b'{"response": {"docs": [{"id": "1"}], "numFound": 1}}',
+        }
+    )
+    client._get_http_session = Mock(return_value=session)
+
+    results = await client.semantic_search_batch(
+        ["bitcoin", "cached", "mining", "bitcoin"], "test_collection", top_k=3
+    )
+
+    assert len(results) == 4
+    assert all(r["result-set"]["docs"][0] == {"id": "1"} for r in results)
+    urls = [call.args[0] for call in session.post.call_args_list]
+    assert sum(url.endswith("/api/embed") for url in urls) == 1
+    assert sum(url.endswith("/test_collection/select") for url in urls) == 4
+    embed_call = session.post.call_args_list[0]
+    assert b'"input":["bitcoin","mining"]' in embed_call.kwargs["data"]
+
+
+def test_prepare_knn_request_is_reused():
+    """Test that KNN request constants are built once per target."""
+    request = prepare_knn_request(
+        "http://localhost:8983/solr", "test_collection", "embedding", 5, "id"
+    )
+
+    assert request.url == "http://localhost:8983/solr/test_collection/select"
+    assert request.knn_prefix == "{!knn f=embedding topK=5}"
+    assert request is prepare_knn_request(
+        "http://localhost:8983/solr", "test_collection", "embedding", 5, "id"
+    )
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "query,docs,expected",
+    [
+        (
+            "SELECT id FROM test_collection WHERE a = 1 OR b = 2 LIMIT 5",
+            [{"_docid_": "1"}, {"_docid_": "2"}],
+            "SELECT id FROM test_collection WHERE (a = 1 OR b = 2) "
+            "AND id IN ('1', '2') LIMIT 5",
+        ),
+        (
+            "SELECT * FROM test_collection",
+            [],
+            "SELECT * FROM test_collection WHERE 1 = 0 LIMIT 10",
+        ),
+    ],
+)
+async def test_execute_vector_select_query_filters_ast(client, query, docs, expected):
+    """Test that vector hits are applied to the parsed SQL query."""
+    ast = sqlglot.parse_one(query)
+    client.query_builder.parse_and_validate_select = Mock(
+        return_value=(ast, "test_collection", [])
+    )
+    client.vector_manager.validate_vector_field = AsyncMock(
+        return_value=("embedding", {})
+    )
+    client.vector_manager.execute_vector_search = AsyncMock(
+        return_value={"response": {"docs": docs, "numFound": len(docs)}}
+    )
+    client.query_executor.execute_select_query = AsyncMock(return_value={})
+
+    await client.execute_vector_select_query(query, [0.1, 0.2])
+
+    client.query_executor.execute_select_query.assert_called_once_with(
+        query=expected, collection="test_collection"
+    )
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "field_type,expected",
+    [
+        (
+            {
+                "name": "knn_vector",
+                "class": "solr.DenseVectorField",
+                "vectorDimension": 768,
+                "vectorEncoding": "BYTE",
+                "similarityFunction": "dot_product",
+            },
+            [127, -64],
+        ),
+        (
+            {
+                "name": "knn_vector",
+                "class": "solr.DenseVectorField",
+                "vectorDimension": 768,
+                "similarityFunction": "cosine",
+            },
+            [0.5, -0.25],
+        ),
+    ],
+)
+async def test_execute_vector_select_query_encodes_for_field_type(
+    client, field_type, expected
+):
+    """Test that query vectors are quantized only for BYTE encoded field types."""
+    query = "SELECT id FROM test_collection LIMIT 5"
+    client.query_builder.parse_and_validate_select = Mock(
+        return_value=(sqlglot.parse_one(query), "test_collection", [])
+    )
+    # The encoding is set on the field type, not on the field
+    client.field_manager = FieldManager("http://localhost:8983/solr")
+    client.field_manager.get_schema = Mock(
+        return_value={
+            "fields": [
+                {"name": "id", "type": "string"},
+                {"name": "embedding", "type": "knn_vector", "indexed": True},
+            ],
+            "fieldTypes": [{"name": "string", "class": "solr.StrField"}, field_type],
+        }
+    )
+    client.vector_manager.execute_vector_search = AsyncMock(
+        return_value={"response": {"docs": [], "numFound": 0}}
+    )
+    client.query_executor.execute_select_query = AsyncMock(return_value={})
+
+    await client.execute_vector_select_query(query, [0.5, -0.25])
+
+    call = client.vector_manager.execute_vector_search.call_args
+    assert call.kwargs["field"] == "embedding"
+    assert call.kwargs["vector"] == expected
+
+
+@pytest.mark.parametrize(
+    "query,expected",
+    [
+        ("SELECT * FROM test_collection", "*"),
+        ("select id, title from test_collection", "id, title"),
+        ("SELECT id, score FROM test_collection WHERE a = 1", "id, score"),
+    ],
+)
+def test_extract_fields_from_sql(client, query, expected):
+    """Test that the Solr field list is taken from the parsed SELECT."""
+    assert client._extract_fields_from_sql(sqlglot.parse_one(query)) == expected
+
+
+@pytest.mark.asyncio
+async def test_get_vector_field_is_cached(client):
+    """Test that vector field validation is reused for the same collection."""
+    client.vector_manager.validate_vector_field = AsyncMock(
+        return_value=("embedding", {"name": "embedding"})
+    )
+
+    first = await client._get_vector_field("test_collection", None)
+    second = await client._get_vector_field("test_collection", None)
+
+    assert first == second == ("embedding", {"name": "embedding"})
+    client.vector_manager.validate_vector_field.assert_called_once_with(
+        collection="test_collection", field=None
+    )
+
+
+@pytest.mark.asyncio
+async def test_get_vector_field_cache_expires(client):
+    """Test that stale vector field validations are refreshed."""
+    client.vector_manager.validate_vector_field = AsyncMock(
+        return_value=("embedding", {})
+    )
+
+    with patch("solr_mcp.solr.client.time.time", return_value=1000.0):
+        await client._get_vector_field("test_collection", "embedding")
+    with patch("solr_mcp.solr.client.time.time", return_value=1301.0):
+        await client._get_vector_field("test_collection", "embedding")
+
+    assert client.vector_manager.validate_vector_field.call_count == 2
+    client.field_manager.clear_cache.assert_called_once_with("test_collection")
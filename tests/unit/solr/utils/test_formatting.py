@@ -3,6 +3,7 @@
 import json
 from unittest.mock import Mock, patch
 
+import numpy as np
 import pytest
 from pysolr import Results
 
@@ -11,6 +12,7 @@ from solr_mcp.solr.utils.formatting import (
     format_error_response,
     format_search_results,
     format_sql_response,
+    format_vector,
 )
 
 
@@ -202,3 +204,18 @@ def test_format_search_results_with_empty_highlighting(mock_results):
     mock_results.highlighting = {}
     formatted = json.loads(format_search_results(mock_results))
     assert "highlighting" not in formatted["result-set"]
+
+
+def test_format_vector():
+    """Test formatting a vector as a Solr KNN literal."""
+    assert format_vector([0.1, 0.2, 0.3]) == "[0.1,0.2,0.3]"
+    assert format_vector([1, -2.5]) == "[1,-2.5]"
+    assert format_vector([]) == "[]"
+
+
+def test_format_vector_preserves_float32_precision():
+    """Test that formatted values round-trip through float32."""
+    vector = np.random.default_rng(0).random(768, dtype=np.float32)
+    literal = format_vector(vector.tolist())
+    parsed = np.array([float(x) for x in literal[1:-1].split(",")], dtype=np.float32)
+    assert np.array_equal(parsed, vector)
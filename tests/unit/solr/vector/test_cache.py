@@ -0,0 +1,95 @@
+"""Tests for solr_mcp.solr.vector.cache module."""
+
+import time
+from unittest.mock import patch
+
+import pytest
+
+from solr_mcp.solr.vector.cache import EmbeddingCache, SemanticResultCache
+
+
+@pytest.fixture
+def embedding_cache() -> EmbeddingCache:
+    """Create a small EmbeddingCache."""
+    return EmbeddingCache(max_size=2)
+
+
+@pytest.fixture
+def semantic_cache() -> SemanticResultCache:
+    """Create a SemanticResultCache."""
+    return SemanticResultCache(threshold=0.97)
+
+
+def test_embedding_cache_get_set(embedding_cache):
+    """Test caching and retrieving an embedding."""
+    assert embedding_cache.get("model", "text") is None
+    embedding_cache.set("model", "text", [0.1, 0.2])
+    cached = embedding_cache.get("model", "text")
+    assert cached.vector == [0.1, 0.2]
+    assert cached.knn_literal({"vectorEncoding": "FLOAT32"}) == "[0.1,0.2]"
+    assert cached.knn_literal({"vectorEncoding": "BYTE"}) == "[64,127]"
+    assert embedding_cache.get("other-model", "text") is None
+
+
+def test_embedding_cache_formats_literal_once(embedding_cache):
+    """Test that the KNN literal for an encoding is formatted on first use only."""
+    cached = embedding_cache.set("model", "text", [0.1, 0.2])
+    byte_field = {"vectorEncoding": "BYTE"}
+
+    with patch(
+        "solr_mcp.solr.vector.cache.format_vector", return_value="[64,127]"
+    ) as format_vector:
+        cached.knn_literal(byte_field)
+        assert (
+            embedding_cache.get("model", "text").knn_literal(byte_field) == "[64,127]"
+        )
+
+    format_vector.assert_called_once()
+
+
+def test_embedding_cache_evicts_least_recently_used(embedding_cache):
+    """Test LRU eviction when the cache is full."""
+    embedding_cache.set("model", "a", [1.0])
+    embedding_cache.set("model", "b", [2.0])
+    embedding_cache.get("model", "a")
+    embedding_cache.set("model", "c", [3.0])
+
+    assert len(embedding_cache) == 2
+    assert embedding_cache.get("model", "a").vector == [1.0]
+    assert embedding_cache.get("model", "b") is None
+    assert embedding_cache.get("model", "c").vector == [3.0]
+
+
+def test_embedding_cache_clear(embedding_cache):
+    """Test clearing the embedding cache."""
+    embedding_cache.set("model", "text", [0.1])
+    embedding_cache.clear()
+    assert len(embedding_cache) == 0
+
+
+def test_semantic_cache_hit_for_similar_vector(semantic_cache):
+    """Test that a near-identical query vector reuses the cached result."""
+    result = {"result-set": {"docs": [{"id": "1"}]}}
+    semantic_cache.set("SELECT * FROM c", [1.0, 0.0, 0.0], result)
+
+    cached = semantic_cache.get("SELECT * FROM c", [0.99, 0.01, 0.0])
+    assert cached == result
+    assert cached is not result
+
+
+def test_semantic_cache_miss(semantic_cache):
+    """Test misses for dissimilar vectors and different scopes."""
+    semantic_cache.set("SELECT * FROM c", [1.0, 0.0], {"result-set": {}})
+
+    assert semantic_cache.get("SELECT * FROM c", [0.0, 1.0]) is None
+    assert semantic_cache.get("SELECT id FROM c", [1.0, 0.0]) is None
+
+
+def test_semantic_cache_expires_entries():
+    """Test that stale results are not reused."""
+    cache = SemanticResultCache(max_age=10.0)
+    now = time.time()
+    with patch("time.time", return_value=now):
+        cache.set("q", [1.0, 0.0], {"result-set": {}})
+    with patch("time.time", return_value=now + 11.0):
+        assert cache.get("q", [1.0, 0.0]) is None
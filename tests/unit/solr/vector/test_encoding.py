@@ -0,0 +1,45 @@
+"""Tests for solr_mcp.solr.vector.encoding module."""
+
+import numpy as np
+import pytest
+
+from solr_mcp.solr.vector.encoding import (
+    encode_for_field,
+    normalize_vector,
+    quantize_vector,
+)
+
+
+def test_normalize_vector():
+    """Test that vectors are scaled to unit length."""
+    normalized = normalize_vector([3.0, 4.0])
+    assert normalized == pytest.approx([0.6, 0.8])
+    assert np.linalg.norm(normalized) == pytest.approx(1.0)
+
+
+def test_normalize_zero_vector():
+    """Test that zero vectors stay zero instead of producing NaN."""
+    assert normalize_vector([0.0, 0.0]) == [0.0, 0.0]
+
+
+def test_quantize_vector():
+    """Test that the largest magnitude maps to the int8 bound."""
+    assert quantize_vector([0.5, -0.25, 0.0]) == [127, -64, 0]
+
+
+def test_quantize_zero_vector():
+    """Test that zero vectors quantize to zeros."""
+    assert quantize_vector([0.0, 0.0]) == [0, 0]
+
+
+@pytest.mark.parametrize(
+    "field_info,expected",
+    [
+        ({"vectorEncoding": "BYTE"}, [127, -64]),
+        ({"vectorEncoding": "FLOAT32"}, [0.5, -0.25]),
+        ({}, [0.5, -0.25]),
+    ],
+)
+def test_encode_for_field(field_info, expected):
+    """Test that vectors are quantized only for BYTE encoded fields."""
+    assert list(encode_for_field([0.5, -0.25], field_info)) == expected
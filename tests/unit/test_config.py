@@ -8,6 +8,21 @@ import pytest
 from solr_mcp.solr.config import SolrConfig
 from solr_mcp.solr.exceptions import ConfigurationError
 
+# Config file contents, serialized once at import
+_VALID_CONFIG_JSON = json.dumps(
+    {
+        "solr_base_url": "http://test:8983/solr",
+        "zookeeper_hosts": ["test:2181"],
+        "connection_timeout": 20,
+    }
+)
+_MISSING_ZK_CONFIG_JSON = json.dumps(
+    {
+        "solr_base_url": "http://test:8983/solr"
+        # Missing zookeeper_hosts
+    }
+)
+
 
 def test_config_defaults():
     """Test default configuration values."""
@@ -49,35 +64,25 @@ def test_config_validation():
 
 def test_load_from_file():
     """Test loading configuration from file."""
-    config_data = {
-        "solr_base_url": "http://test:8983/solr",
-        "zookeeper_hosts": ["test:2181"],
-        "connection_timeout": 20,
-    }
-
-    with patch("builtins.open", mock_open(read_data=json.dumps(config_data))):
+    with patch("builtins.open", mock_open(read_data=_VALID_CONFIG_JSON)):
         config = SolrConfig.load("config.json")
-        assert config.solr_base_url == "http://test:8983/solr"
-        assert config.zookeeper_hosts == ["test:2181"]
-        assert config.connection_timeout == 20
-
-
-def test_load_invalid_json():
-    """Test loading invalid JSON."""
-    with patch("builtins.open", mock_open(read_data="invalid json")):
-        with pytest.raises(
-            ConfigurationError, match="Invalid JSON in configuration file"
-        ):
-            SolrConfig.load("config.json")
 
+    assert config.solr_base_url == "http://test:8983/solr"
+    assert config.zookeeper_hosts == ["test:2181"]
+    assert config.connection_timeout == 20
 
-def test_load_missing_required_field():
-    """Test loading config with missing required field."""
-    config_data = {
-        "solr_base_url": "http://test:8983/solr"
-        # Missing zookeeper_hosts
-    }
 
-    with patch("builtins.open", mock_open(read_data=json.dumps(config_data))):
-        with pytest.raises(ConfigurationError, match="zookeeper_hosts is required"):
+@pytest.mark.parametrize(
+    "data, match",
+    [
+        # Invalid JSON
+        ("invalid json", "Invalid JSON in configuration file"),
+        # Missing required field
+        (_MISSING_ZK_CONFIG_JSON, "zookeeper_hosts is required"),
+    ],
+)
+def test_load_from_file_invalid(data, match):
+    """Test loading an invalid configuration file."""
+    with patch("builtins.open", mock_open(read_data=data)):
+        with pytest.raises(ConfigurationError, match=match):
             SolrConfig.load("config.json")
@@ -1,6 +1,6 @@
 """Tests for tool decorator functionality."""
 
-from typing import Any, List, Literal, Optional, Union
+from typing import Annotated, Any, List, Literal, Optional, Union
 
 import pytest
 
@@ -242,3 +242,64 @@ def test_get_schema_edge_cases():
 
     # Test that Any type is handled correctly
     assert properties["param1"]["type"] == "string"
+
+
+def test_get_schema_is_cached():
+    """Test that the schema is built once, when the tool is decorated."""
+
+    @tool()
+    async def cached_tool(param: str):
+        """Cached tool."""
+        pass
+
+    assert get_schema(cached_tool) is get_schema(cached_tool)
+    assert get_schema(cached_tool) is cached_tool._tool_schema
+
+
+def test_get_schema_stores_schema_of_undecorated_tool():
+    """Test that a tool marked outside tool() has its schema stored on first use."""
+
+    async def marked_tool(param: str):
+        """Marked tool."""
+        pass
+
+    marked_tool._is_tool = True
+
+    schema = get_schema(marked_tool)
+
+    assert marked_tool._tool_schema is schema
+    assert get_schema(marked_tool) is schema
+
+
+def test_get_schema_does_not_share_type_schemas():
+    """Test that parameter descriptions do not leak into other type schemas."""
+
+    @tool()
+    async def shared_type_tool(name: str, tags: List[str]):
+        """Tool with repeated types.
+
+        Args:
+            name: Name parameter
+            tags: Tags parameter
+        """
+        pass
+
+    properties = get_schema(shared_type_tool)["inputSchema"]["properties"]
+    assert properties["tags"]["items"] == {"type": "string"}
+
+
+def test_get_schema_unwraps_optional_forms():
+    """Test that Annotated and PEP 604 optional annotations resolve like Optional."""
+
+    @tool()
+    async def optional_forms_tool(
+        count: Annotated[int, "metadata"],
+        limit: int | None = None,
+    ):
+        """Tool with alternative optional forms."""
+        pass
+
+    schema = get_schema(optional_forms_tool)["inputSchema"]
+    assert schema["properties"]["count"]["type"] == "integer"
+    assert schema["properties"]["limit"]["type"] == "integer"
+    assert schema["required"] == ["count"]